@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 
+from django.db.models import Q
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 
@@ -11,6 +12,28 @@ from search.models import ProviderType
 from search.providers.results import BookMetadata
 
 
+_MEDIA_STATUS_DISPLAY = dict(MediaStatus.choices)
+_MISSING_STATUS = {"exists": False, "status": None, "status_display": None}
+
+
+def _statuses_by_key(
+    model: type[Book | Audiobook], lookups: Q
+) -> dict[tuple[str, str], dict]:
+    statuses: dict[tuple[str, str], dict] = {}
+    for provider, external_id, status in model.objects.filter(lookups).values_list(
+        "provider", "external_id", "status"
+    ):
+        statuses.setdefault(
+            (provider, external_id),
+            {
+                "exists": True,
+                "status": status,
+                "status_display": _MEDIA_STATUS_DISPLAY.get(status, status),
+            },
+        )
+    return statuses
+
+
 @require_http_methods(["GET", "POST"])
 def get_media_status(request):
     if request.method == "GET":
@@ -61,6 +84,16 @@ def get_media_status(request):
     statuses = []
     valid_providers = [choice[0] for choice in ProviderType.choices]
 
+    lookups = Q()
+    for item in items:
+        if item["provider"] in valid_providers:
+            lookups |= Q(provider=item["provider"], external_id=item["external_id"])
+    if lookups:
+        book_statuses = _statuses_by_key(Book, lookups)
+        audiobook_statuses = _statuses_by_key(Audiobook, lookups)
+    else:
+        book_statuses = audiobook_statuses = {}
+
     for item in items:
         provider = item["provider"]
         external_id = item["external_id"]
@@ -85,48 +118,13 @@ def get_media_status(request):
             )
             continue
 
-        book_match = Book.objects.filter(
-            provider=provider, external_id=external_id
-        ).first()
-        audiobook_match = Audiobook.objects.filter(
-            provider=provider, external_id=external_id
-        ).first()
-
-        book_status = None
-        audiobook_status = None
-
-        if book_match:
-            book_status = {
-                "exists": True,
-                "status": book_match.status,
-                "status_display": book_match.get_status_display(),
-            }
-        else:
-            book_status = {
-                "exists": False,
-                "status": None,
-                "status_display": None,
-            }
-
-        if audiobook_match:
-            audiobook_status = {
-                "exists": True,
-                "status": audiobook_match.status,
-                "status_display": audiobook_match.get_status_display(),
-            }
-        else:
-            audiobook_status = {
-                "exists": False,
-                "status": None,
-                "status_display": None,
-            }
-
+        key = (provider, str(external_id))
         statuses.append(
             {
                 "provider": provider,
                 "external_id": external_id,
-                "book": book_status,
-                "audiobook": audiobook_status,
+                "book": book_statuses.get(key, _MISSING_STATUS),
+                "audiobook": audiobook_statuses.get(key, _MISSING_STATUS),
             }
         )
 
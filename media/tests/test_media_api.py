@@ -4,19 +4,31 @@ import json
 from datetime import date
 
 import pytest
-from django.test import Client
+from django.db.models import Exists
+from django.test import Client, RequestFactory
 from django.urls import reverse
 
 from core.models import MediaStatus
+from media.api import add_wanted_media, get_media_status
 from media.models import Audiobook, Book
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> Client:
     return Client()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def status_url() -> str:
+    return reverse("media:get_media_status")
+
+
+@pytest.fixture(scope="session")
+def add_url() -> str:
+    return reverse("media:add_wanted_media")
+
+
+@pytest.fixture(scope="session")
 def sample_metadata() -> dict:
     return {
         "provider": "openlibrary",
@@ -41,8 +53,20 @@ def sample_metadata() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def add_book_body(sample_metadata: dict) -> str:
+    return json.dumps(
+        {
+            "provider": "openlibrary",
+            "external_id": "OL123456W",
+            "media_type": "book",
+            "metadata": sample_metadata,
+        }
+    )
+
+
 @pytest.fixture
-def sample_book(sample_metadata: dict) -> Book:
+def sample_book(db, sample_metadata: dict) -> Book:
     return Book.objects.create(
         provider="openlibrary",
         external_id="OL123456W",
@@ -59,7 +83,7 @@ def sample_book(sample_metadata: dict) -> Book:
 
 
 @pytest.fixture
-def sample_audiobook(sample_metadata: dict) -> Audiobook:
+def sample_audiobook(db, sample_metadata: dict) -> Audiobook:
     return Audiobook.objects.create(
         provider="openlibrary",
         external_id="OL789012W",
@@ -76,68 +100,73 @@ def sample_audiobook(sample_metadata: dict) -> Audiobook:
     )
 
 
-@pytest.mark.django_db
 class TestGetMediaStatus:
-    def test_get_status_with_query_params_existing_book(
-        self, client: Client, sample_book: Book
-    ):
-        url = reverse("media:get_media_status")
-        response = client.get(
-            url, {"providers": "openlibrary", "external_ids": "OL123456W"}
-        )
-
-        assert response.status_code == 200
-        data = json.loads(response.content)
-        assert len(data["statuses"]) == 1
-        assert data["statuses"][0]["provider"] == "openlibrary"
-        assert data["statuses"][0]["external_id"] == "OL123456W"
-        assert data["statuses"][0]["book"]["exists"] is True
-        assert data["statuses"][0]["book"]["status"] == "wanted"
-        assert data["statuses"][0]["book"]["status_display"] == "Wanted"
-        assert data["statuses"][0]["audiobook"]["exists"] is False
-
-    def test_get_status_with_query_params_existing_audiobook(
-        self, client: Client, sample_audiobook: Audiobook
+    @pytest.mark.parametrize(
+        "seed_fixture, external_id, expected_book, expected_audiobook",
+        [
+            (
+                "sample_book",
+                "OL123456W",
+                {"exists": True, "status": "wanted", "status_display": "Wanted"},
+                {"exists": False, "status": None, "status_display": None},
+            ),
+            (
+                "sample_audiobook",
+                "OL789012W",
+                {"exists": False, "status": None, "status_display": None},
+                {
+                    "exists": True,
+                    "status": "downloading",
+                    "status_display": "Downloading",
+                },
+            ),
+            (
+                None,
+                "OL999999W",
+                {"exists": False, "status": None, "status_display": None},
+                {"exists": False, "status": None, "status_display": None},
+            ),
+        ],
+        ids=["existing_book", "existing_audiobook", "non_existing"],
+    )
+    def test_get_status_with_query_params_single_item(
+        self,
+        db,
+        request: pytest.FixtureRequest,
+        client: Client,
+        status_url: str,
+        seed_fixture: str | None,
+        external_id: str,
+        expected_book: dict,
+        expected_audiobook: dict,
     ):
-        url = reverse("media:get_media_status")
-        response = client.get(
-            url, {"providers": "openlibrary", "external_ids": "OL789012W"}
-        )
+        if seed_fixture:
+            request.getfixturevalue(seed_fixture)
 
-        assert response.status_code == 200
-        data = json.loads(response.content)
-        assert len(data["statuses"]) == 1
-        assert data["statuses"][0]["provider"] == "openlibrary"
-        assert data["statuses"][0]["external_id"] == "OL789012W"
-        assert data["statuses"][0]["book"]["exists"] is False
-        assert data["statuses"][0]["audiobook"]["exists"] is True
-        assert data["statuses"][0]["audiobook"]["status"] == "downloading"
-        assert data["statuses"][0]["audiobook"]["status_display"] == "Downloading"
-
-    def test_get_status_with_query_params_non_existing(self, client: Client):
-        url = reverse("media:get_media_status")
         response = client.get(
-            url, {"providers": "openlibrary", "external_ids": "OL999999W"}
+            status_url, {"providers": "openlibrary", "external_ids": external_id}
         )
 
         assert response.status_code == 200
-        data = json.loads(response.content)
-        assert len(data["statuses"]) == 1
-        assert data["statuses"][0]["provider"] == "openlibrary"
-        assert data["statuses"][0]["external_id"] == "OL999999W"
-        assert data["statuses"][0]["book"]["exists"] is False
-        assert data["statuses"][0]["book"]["status"] is None
-        assert data["statuses"][0]["book"]["status_display"] is None
-        assert data["statuses"][0]["audiobook"]["exists"] is False
-        assert data["statuses"][0]["audiobook"]["status"] is None
-        assert data["statuses"][0]["audiobook"]["status_display"] is None
+        data = response.json()
+        assert data["statuses"] == [
+            {
+                "provider": "openlibrary",
+                "external_id": external_id,
+                "book": expected_book,
+                "audiobook": expected_audiobook,
+            }
+        ]
 
     def test_get_status_with_query_params_multiple_items(
-        self, client: Client, sample_book: Book, sample_audiobook: Audiobook
+        self,
+        client: Client,
+        status_url: str,
+        sample_book: Book,
+        sample_audiobook: Audiobook,
     ):
-        url = reverse("media:get_media_status")
         response = client.get(
-            url,
+            status_url,
             {
                 "providers": "openlibrary,openlibrary",
                 "external_ids": "OL123456W,OL789012W",
@@ -145,70 +174,50 @@ class TestGetMediaStatus:
         )
 
         assert response.status_code == 200
-        data = json.loads(response.content)
+        data = response.json()
         assert len(data["statuses"]) == 2
         assert data["statuses"][0]["book"]["exists"] is True
         assert data["statuses"][0]["book"]["status"] == "wanted"
         assert data["statuses"][1]["audiobook"]["exists"] is True
         assert data["statuses"][1]["audiobook"]["status"] == "downloading"
 
-    def test_get_status_with_query_params_missing_providers(self, client: Client):
-        url = reverse("media:get_media_status")
-        response = client.get(url, {"external_ids": "OL123456W"})
-
-        assert response.status_code == 400
-        data = json.loads(response.content)
-        assert "error" in data
-        assert "providers" in data["error"].lower()
-
-    def test_get_status_with_query_params_missing_external_ids(self, client: Client):
-        url = reverse("media:get_media_status")
-        response = client.get(url, {"providers": "openlibrary"})
-
-        assert response.status_code == 400
-        data = json.loads(response.content)
-        assert "error" in data
-        assert "external_ids" in data["error"].lower()
-
-    def test_get_status_with_query_params_mismatched_lengths(self, client: Client):
-        url = reverse("media:get_media_status")
-        response = client.get(
-            url,
-            {
-                "providers": "openlibrary,openlibrary",
-                "external_ids": "OL123456W",
-            },
-        )
-
-        assert response.status_code == 400
-        data = json.loads(response.content)
-        assert "error" in data
-        assert "length" in data["error"].lower()
-
+    @pytest.mark.parametrize(
+        "stored_id, requested_id",
+        [("OL123456W", "OL123456W"), ("12345", 12345)],
+        ids=["string_id", "int_id"],
+    )
     def test_get_status_with_post_existing_book(
-        self, client: Client, sample_book: Book
+        self,
+        client: Client,
+        status_url: str,
+        sample_book: Book,
+        stored_id: str,
+        requested_id: str | int,
     ):
-        url = reverse("media:get_media_status")
+        sample_book.external_id = stored_id
+        sample_book.save(update_fields=["external_id"])
         payload = {
             "items": [
-                {"provider": "openlibrary", "external_id": "OL123456W"},
+                {"provider": "openlibrary", "external_id": requested_id},
             ]
         }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
-        )
+        response = client.post(status_url, payload, content_type="application/json")
 
         assert response.status_code == 200
-        data = json.loads(response.content)
+        data = response.json()
         assert len(data["statuses"]) == 1
         assert data["statuses"][0]["book"]["exists"] is True
         assert data["statuses"][0]["book"]["status"] == "wanted"
         assert data["statuses"][0]["audiobook"]["exists"] is False
 
     def test_get_status_with_post_multiple_items(
-        self, client: Client, sample_book: Book, sample_audiobook: Audiobook
+        self,
+        client: Client,
+        status_url: str,
+        sample_book: Book,
+        sample_audiobook: Audiobook,
+        django_assert_num_queries,
     ):
-        url = reverse("media:get_media_status")
         payload = {
             "items": [
                 {"provider": "openlibrary", "external_id": "OL123456W"},
@@ -216,56 +225,24 @@ class TestGetMediaStatus:
                 {"provider": "openlibrary", "external_id": "OL999999W"},
             ]
         }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
-        )
+        with django_assert_num_queries(2):
+            response = client.post(status_url, payload, content_type="application/json")
 
         assert response.status_code == 200
-        data = json.loads(response.content)
+        data = response.json()
         assert len(data["statuses"]) == 3
         assert data["statuses"][0]["book"]["exists"] is True
         assert data["statuses"][1]["audiobook"]["exists"] is True
         assert data["statuses"][2]["book"]["exists"] is False
         assert data["statuses"][2]["audiobook"]["exists"] is False
 
-    def test_get_status_with_post_invalid_json(self, client: Client):
-        url = reverse("media:get_media_status")
-        response = client.post(url, "invalid json", content_type="application/json")
-
-        assert response.status_code == 400
-        data = json.loads(response.content)
-        assert "error" in data
-
-    def test_get_status_with_post_missing_items(self, client: Client):
-        url = reverse("media:get_media_status")
-        payload = {}
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
-        )
-
-        assert response.status_code == 400
-        data = json.loads(response.content)
-        assert "error" in data
-
-    def test_get_status_with_post_invalid_item_structure(self, client: Client):
-        url = reverse("media:get_media_status")
-        payload = {"items": [{"provider": "openlibrary"}]}
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
-        )
-
-        assert response.status_code == 400
-        data = json.loads(response.content)
-        assert "error" in data
-
-    def test_get_status_invalid_provider(self, client: Client):
-        url = reverse("media:get_media_status")
+    def test_get_status_invalid_provider(self, client: Client, status_url: str):
         response = client.get(
-            url, {"providers": "invalid_provider", "external_ids": "OL123456W"}
+            status_url, {"providers": "invalid_provider", "external_ids": "OL123456W"}
         )
 
         assert response.status_code == 200
-        data = json.loads(response.content)
+        data = response.json()
         assert len(data["statuses"]) == 1
         assert data["statuses"][0]["book"]["exists"] is False
         assert data["statuses"][0]["audiobook"]["exists"] is False
@@ -273,7 +250,7 @@ class TestGetMediaStatus:
         assert "invalid" in data["statuses"][0]["error"].lower()
 
     def test_get_status_book_takes_precedence_over_audiobook(
-        self, client: Client, sample_book: Book
+        self, client: Client, status_url: str, sample_book: Book
     ):
         Audiobook.objects.create(
             provider="openlibrary",
@@ -283,47 +260,88 @@ class TestGetMediaStatus:
             status=MediaStatus.DOWNLOADING,
         )
 
-        url = reverse("media:get_media_status")
         response = client.get(
-            url, {"providers": "openlibrary", "external_ids": "OL123456W"}
+            status_url, {"providers": "openlibrary", "external_ids": "OL123456W"}
         )
 
         assert response.status_code == 200
-        data = json.loads(response.content)
+        data = response.json()
         assert data["statuses"][0]["book"]["exists"] is True
         assert data["statuses"][0]["book"]["status"] == "wanted"
         assert data["statuses"][0]["audiobook"]["exists"] is True
         assert data["statuses"][0]["audiobook"]["status"] == "downloading"
 
 
-@pytest.mark.django_db
-class TestAddWantedMedia:
-    def test_add_wanted_book_success(self, client: Client, sample_metadata: dict):
-        url = reverse("media:add_wanted_media")
-        payload = {
-            "provider": "openlibrary",
-            "external_id": "OL123456W",
-            "media_type": "book",
-            "metadata": sample_metadata,
-        }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
+class TestGetMediaStatusValidation:
+    @pytest.mark.parametrize(
+        "params, expected_error",
+        [
+            ({"external_ids": "OL123456W"}, "providers"),
+            ({"providers": "openlibrary"}, "external_ids"),
+            (
+                {"providers": "openlibrary,openlibrary", "external_ids": "OL123456W"},
+                "length",
+            ),
+        ],
+        ids=["missing_providers", "missing_external_ids", "mismatched_lengths"],
+    )
+    def test_get_status_with_query_params_rejects_invalid(
+        self, rf: RequestFactory, status_url: str, params: dict, expected_error: str
+    ):
+        response = get_media_status(rf.get(status_url, params))
+
+        assert response.status_code == 400
+        data = json.loads(response.content)
+        assert "error" in data
+        assert expected_error in data["error"].lower()
+
+    @pytest.mark.parametrize(
+        "payload",
+        ["invalid json", {}, {"items": [{"provider": "openlibrary"}]}],
+        ids=["invalid_json", "missing_items", "invalid_item_structure"],
+    )
+    def test_get_status_with_post_rejects_invalid(
+        self, rf: RequestFactory, status_url: str, payload: str | dict
+    ):
+        response = get_media_status(
+            rf.post(status_url, payload, content_type="application/json")
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 400
         data = json.loads(response.content)
+        assert "error" in data
+
+
+class TestAddWantedMedia:
+    def test_add_wanted_book_success(
+        self,
+        db,
+        client: Client,
+        add_url: str,
+        add_book_body: str,
+        sample_metadata: dict,
+    ):
+        response = client.post(add_url, add_book_body, content_type="application/json")
+
+        assert response.status_code == 200
+        data = response.json()
         assert data["success"] is True
         assert "media_id" in data
         assert data["status"] == "wanted"
         assert data["status_display"] == "Wanted"
 
-        book = Book.objects.get(provider="openlibrary", external_id="OL123456W")
-        assert book.title == sample_metadata["title"]
-        assert book.authors == sample_metadata["authors"]
-        assert book.status == MediaStatus.WANTED
+        book = (
+            Book.objects.filter(provider="openlibrary", external_id="OL123456W")
+            .values("title", "authors", "status")
+            .get()
+        )
+        assert book["title"] == sample_metadata["title"]
+        assert book["authors"] == sample_metadata["authors"]
+        assert book["status"] == MediaStatus.WANTED
 
-    def test_add_wanted_audiobook_success(self, client: Client, sample_metadata: dict):
-        url = reverse("media:add_wanted_media")
+    def test_add_wanted_audiobook_success(
+        self, db, client: Client, add_url: str, sample_metadata: dict
+    ):
         audiobook_metadata = sample_metadata.copy()
         audiobook_metadata.update(
             {
@@ -338,39 +356,30 @@ class TestAddWantedMedia:
             "media_type": "audiobook",
             "metadata": audiobook_metadata,
         }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
-        )
+        response = client.post(add_url, payload, content_type="application/json")
 
         assert response.status_code == 200
-        data = json.loads(response.content)
+        data = response.json()
         assert data["success"] is True
         assert "media_id" in data
         assert data["status"] == "wanted"
 
-        audiobook = Audiobook.objects.get(
-            provider="openlibrary", external_id="OL789012W"
+        audiobook = (
+            Audiobook.objects.filter(provider="openlibrary", external_id="OL789012W")
+            .values("title", "narrators", "status")
+            .get()
         )
-        assert audiobook.title == audiobook_metadata["title"]
-        assert audiobook.narrators == audiobook_metadata["narrators"]
-        assert audiobook.status == MediaStatus.WANTED
+        assert audiobook["title"] == audiobook_metadata["title"]
+        assert audiobook["narrators"] == audiobook_metadata["narrators"]
+        assert audiobook["status"] == MediaStatus.WANTED
 
     def test_add_wanted_book_already_exists(
-        self, client: Client, sample_book: Book, sample_metadata: dict
+        self, client: Client, add_url: str, add_book_body: str, sample_book: Book
     ):
-        url = reverse("media:add_wanted_media")
-        payload = {
-            "provider": "openlibrary",
-            "external_id": "OL123456W",
-            "media_type": "book",
-            "metadata": sample_metadata,
-        }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
-        )
+        response = client.post(add_url, add_book_body, content_type="application/json")
 
         assert response.status_code == 200
-        data = json.loads(response.content)
+        data = response.json()
         assert data["success"] is False
         assert data["error"] == "already_exists"
         assert data["status"] == "wanted"
@@ -382,9 +391,12 @@ class TestAddWantedMedia:
         assert books_count == 1
 
     def test_add_wanted_audiobook_already_exists(
-        self, client: Client, sample_audiobook: Audiobook, sample_metadata: dict
+        self,
+        client: Client,
+        add_url: str,
+        sample_audiobook: Audiobook,
+        sample_metadata: dict,
     ):
-        url = reverse("media:add_wanted_media")
         audiobook_metadata = sample_metadata.copy()
         audiobook_metadata["provider_id"] = "OL789012W"
         payload = {
@@ -393,76 +405,103 @@ class TestAddWantedMedia:
             "media_type": "audiobook",
             "metadata": audiobook_metadata,
         }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
-        )
+        response = client.post(add_url, payload, content_type="application/json")
 
         assert response.status_code == 200
-        data = json.loads(response.content)
+        data = response.json()
         assert data["success"] is False
         assert data["error"] == "already_exists"
         assert data["status"] == "downloading"
 
-    def test_add_wanted_missing_provider(self, client: Client, sample_metadata: dict):
-        url = reverse("media:add_wanted_media")
+    def test_add_wanted_minimal_metadata(self, db, client: Client, add_url: str):
         payload = {
+            "provider": "openlibrary",
             "external_id": "OL123456W",
             "media_type": "book",
-            "metadata": sample_metadata,
+            "metadata": {
+                "provider": "openlibrary",
+                "provider_id": "OL123456W",
+                "title": "Minimal Book",
+            },
         }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
-        )
+        response = client.post(add_url, payload, content_type="application/json")
 
-        assert response.status_code == 400
-        data = json.loads(response.content)
-        assert "error" in data
-        assert "provider" in data["error"].lower()
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
 
-    def test_add_wanted_missing_external_id(
-        self, client: Client, sample_metadata: dict
+        title = Book.objects.values_list("title", flat=True).get(
+            provider="openlibrary", external_id="OL123456W"
+        )
+        assert title == "Minimal Book"
+
+    def test_add_wanted_book_and_audiobook_same_external_id(
+        self,
+        db,
+        client: Client,
+        add_url: str,
+        add_book_body: str,
+        sample_metadata: dict,
     ):
-        url = reverse("media:add_wanted_media")
-        payload = {
+        response = client.post(add_url, add_book_body, content_type="application/json")
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+
+        audiobook_metadata = sample_metadata.copy()
+        audiobook_metadata["provider_id"] = "OL123456W"
+        audiobook_payload = {
             "provider": "openlibrary",
-            "media_type": "book",
-            "metadata": sample_metadata,
+            "external_id": "OL123456W",
+            "media_type": "audiobook",
+            "metadata": audiobook_metadata,
         }
         response = client.post(
-            url, json.dumps(payload), content_type="application/json"
+            add_url, audiobook_payload, content_type="application/json"
         )
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+
+        lookup = {"provider": "openlibrary", "external_id": "OL123456W"}
+        audiobook_exists = (
+            Book.objects.filter(**lookup)
+            .annotate(audiobook_exists=Exists(Audiobook.objects.filter(**lookup)))
+            .values_list("audiobook_exists", flat=True)
+        )
+        assert list(audiobook_exists) == [True]
 
-        assert response.status_code == 400
-        data = json.loads(response.content)
-        assert "error" in data
-        assert "external_id" in data["error"].lower()
 
-    def test_add_wanted_missing_media_type(self, client: Client, sample_metadata: dict):
-        url = reverse("media:add_wanted_media")
+class TestAddWantedMediaValidation:
+    @pytest.mark.parametrize("missing", ["provider", "external_id", "media_type"])
+    def test_add_wanted_missing_field(
+        self, rf: RequestFactory, add_url: str, sample_metadata: dict, missing: str
+    ):
         payload = {
             "provider": "openlibrary",
             "external_id": "OL123456W",
+            "media_type": "book",
             "metadata": sample_metadata,
         }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
+        del payload[missing]
+        response = add_wanted_media(
+            rf.post(add_url, payload, content_type="application/json")
         )
 
         assert response.status_code == 400
         data = json.loads(response.content)
         assert "error" in data
-        assert "media_type" in data["error"].lower()
+        assert missing in data["error"].lower()
 
-    def test_add_wanted_invalid_media_type(self, client: Client, sample_metadata: dict):
-        url = reverse("media:add_wanted_media")
+    def test_add_wanted_invalid_media_type(
+        self, rf: RequestFactory, add_url: str, sample_metadata: dict
+    ):
         payload = {
             "provider": "openlibrary",
             "external_id": "OL123456W",
             "media_type": "invalid",
             "metadata": sample_metadata,
         }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
+        response = add_wanted_media(
+            rf.post(add_url, payload, content_type="application/json")
         )
 
         assert response.status_code == 400
@@ -471,88 +510,29 @@ class TestAddWantedMedia:
         assert "book" in data["message"].lower()
         assert "audiobook" in data["message"].lower()
 
-    def test_add_wanted_invalid_json(self, client: Client):
-        url = reverse("media:add_wanted_media")
-        response = client.post(url, "invalid json", content_type="application/json")
+    def test_add_wanted_invalid_json(self, rf: RequestFactory, add_url: str):
+        response = add_wanted_media(
+            rf.post(add_url, "invalid json", content_type="application/json")
+        )
 
         assert response.status_code == 400
         data = json.loads(response.content)
         assert "error" in data
 
-    def test_add_wanted_minimal_metadata(self, client: Client):
-        url = reverse("media:add_wanted_media")
-        payload = {
-            "provider": "openlibrary",
-            "external_id": "OL123456W",
-            "media_type": "book",
-            "metadata": {
-                "provider": "openlibrary",
-                "provider_id": "OL123456W",
-                "title": "Minimal Book",
-            },
-        }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
-        )
-
-        assert response.status_code == 200
-        data = json.loads(response.content)
-        assert data["success"] is True
-
-        book = Book.objects.get(provider="openlibrary", external_id="OL123456W")
-        assert book.title == "Minimal Book"
-
-    def test_add_wanted_invalid_provider(self, client: Client, sample_metadata: dict):
-        url = reverse("media:add_wanted_media")
+    def test_add_wanted_invalid_provider(
+        self, rf: RequestFactory, add_url: str, sample_metadata: dict
+    ):
         payload = {
             "provider": "invalid_provider",
             "external_id": "OL123456W",
             "media_type": "book",
             "metadata": sample_metadata,
         }
-        response = client.post(
-            url, json.dumps(payload), content_type="application/json"
+        response = add_wanted_media(
+            rf.post(add_url, payload, content_type="application/json")
         )
 
         assert response.status_code == 400
         data = json.loads(response.content)
         assert data["error"] == "invalid_provider"
         assert "provider" in data["message"].lower()
-
-    def test_add_wanted_book_and_audiobook_same_external_id(
-        self, client: Client, sample_metadata: dict
-    ):
-        url = reverse("media:add_wanted_media")
-
-        book_payload = {
-            "provider": "openlibrary",
-            "external_id": "OL123456W",
-            "media_type": "book",
-            "metadata": sample_metadata,
-        }
-        response = client.post(
-            url, json.dumps(book_payload), content_type="application/json"
-        )
-        assert response.status_code == 200
-        assert json.loads(response.content)["success"] is True
-
-        audiobook_metadata = sample_metadata.copy()
-        audiobook_metadata["provider_id"] = "OL123456W"
-        audiobook_payload = {
-            "provider": "openlibrary",
-            "external_id": "OL123456W",
-            "media_type": "audiobook",
-            "metadata": audiobook_metadata,
-        }
-        response = client.post(
-            url, json.dumps(audiobook_payload), content_type="application/json"
-        )
-        assert response.status_code == 200
-        assert json.loads(response.content)["success"] is True
-
-        assert Book.objects.filter(
-            provider="openlibrary", external_id="OL123456W"
-        ).exists()
-        assert Audiobook.objects.filter(
-            provider="openlibrary", external_id="OL123456W"
-        ).exists()
@@ -12,25 +12,25 @@ from processing.services.post_process import (
 )
 
 
+def _ok(message: str) -> JsonResponse:
+    return JsonResponse({"success": True, "message": message})
+
+
+def _err(error: str, status: int = 400) -> JsonResponse:
+    return JsonResponse({"success": False, "error": error}, status=status)
+
+
 @require_http_methods(["POST"])
 def convert_to_epub(request, attempt_id: UUID):
     try:
         result = convert_to_epub_for_attempt(attempt_id)
         if result.get("success"):
-            return JsonResponse(
-                {"success": True, "message": result.get("message", "Conversion successful")}
-            )
-        else:
-            return JsonResponse(
-                {"success": False, "error": result.get("error", "Unknown error")},
-                status=400,
-            )
+            return _ok(str(result.get("message", "Conversion successful")))
+        return _err(str(result.get("error", "Unknown error")))
     except PostProcessingError as e:
-        return JsonResponse({"success": False, "error": str(e)}, status=500)
+        return _err(str(e), status=500)
     except Exception as e:
-        return JsonResponse(
-            {"success": False, "error": f"Conversion failed: {str(e)}"}, status=500
-        )
+        return _err(f"Conversion failed: {str(e)}", status=500)
 
 
 @require_http_methods(["POST"])
@@ -38,18 +38,9 @@ def organize_to_library(request, attempt_id: UUID):
     try:
         result = organize_to_library_for_attempt(attempt_id)
         if result.get("success"):
-            return JsonResponse(
-                {"success": True, "message": result.get("message", "Organization successful")}
-            )
-        else:
-            return JsonResponse(
-                {"success": False, "error": result.get("error", "Unknown error")},
-                status=400,
-            )
+            return _ok(str(result.get("message", "Organization successful")))
+        return _err(str(result.get("error", "Unknown error")))
     except PostProcessingError as e:
-        return JsonResponse({"success": False, "error": str(e)}, status=500)
+        return _err(str(e), status=500)
     except Exception as e:
-        return JsonResponse(
-            {"success": False, "error": f"Organization failed: {str(e)}"}, status=500
-        )
-
+        return _err(f"Organization failed: {str(e)}", status=500)
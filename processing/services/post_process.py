@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import stat
 from pathlib import Path
 from uuid import UUID
 
+from django.core.cache import cache
+
 from core.models_processing import ProcessingConfiguration
 from downloaders.models import DownloadAttempt
 from processing.utils.cover_downloader import CoverDownloadError, download_cover
@@ -19,20 +23,69 @@ from processing.utils.metadata_generator import generate_opf
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_MISS_CACHE_TIMEOUT = 10
+
 
 class PostProcessingError(Exception):
     pass
 
 
-def convert_to_epub_for_attempt(attempt_id: UUID) -> dict[str, str | bool]:
+def _safe_stat(path: str | None) -> os.stat_result | None:
+    if not path:
+        return None
     try:
-        attempt = DownloadAttempt.objects.select_related("download_client").get(
-            id=attempt_id
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _get_attempt(attempt_id: UUID) -> DownloadAttempt:
+    return DownloadAttempt.objects.select_related("download_client").get(
+        id=attempt_id
+    )
+
+
+def _download_miss_cache_key(
+    completed_downloads_path: str,
+    release_title: str,
+    download_client_id: str | None,
+) -> str:
+    raw_key = "\0".join(
+        [completed_downloads_path, release_title, download_client_id or ""]
+    )
+    digest = hashlib.md5(raw_key.encode(), usedforsecurity=False).hexdigest()
+    return f"processing:download_miss:{digest}"
+
+
+def _find_downloaded_file(
+    completed_downloads_path: str,
+    release_title: str,
+    download_client_id: str | None = None,
+) -> str:
+    cache_key = _download_miss_cache_key(
+        completed_downloads_path, release_title, download_client_id
+    )
+    cached_error = cache.get(cache_key)
+    if cached_error is not None:
+        raise FileDiscoveryError(cached_error)
+
+    try:
+        return find_downloaded_file(
+            completed_downloads_path=completed_downloads_path,
+            release_title=release_title,
+            download_client_id=download_client_id,
         )
+    except FileDiscoveryError as e:
+        cache.set(cache_key, str(e), DOWNLOAD_MISS_CACHE_TIMEOUT)
+        raise
+
+
+def convert_to_epub_for_attempt(attempt_id: UUID) -> dict[str, str | bool]:
+    try:
+        attempt = _get_attempt(attempt_id)
     except DownloadAttempt.DoesNotExist:
         return {"success": False, "error": f"Download attempt {attempt_id} not found"}
 
-
     config = ProcessingConfiguration.objects.filter(enabled=True).first()
     if not config:
         return {
@@ -44,22 +97,22 @@ def convert_to_epub_for_attempt(attempt_id: UUID) -> dict[str, str | bool]:
 
     if attempt.raw_file_path and os.path.exists(attempt.raw_file_path):
         input_file_path = attempt.raw_file_path
-        logger.info(f"Using existing raw_file_path: {input_file_path}")
+        logger.info("Using existing raw_file_path: %s", input_file_path)
     else:
         try:
-            input_file_path = find_downloaded_file(
+            input_file_path = _find_downloaded_file(
                 completed_downloads_path=config.completed_downloads_path,
                 release_title=attempt.release_title,
                 download_client_id=attempt.download_client_download_id,
             )
             attempt.raw_file_path = input_file_path
             attempt.save(update_fields=["raw_file_path"])
-            logger.info(f"Found downloaded file: {input_file_path}")
+            logger.info("Found downloaded file: %s", input_file_path)
         except FileDiscoveryError as e:
             return {"success": False, "error": str(e)}
 
-    input_ext = Path(input_file_path).suffix.lower()
-    if input_ext == ".epub":
+    input_path = Path(input_file_path)
+    if input_path.suffix.lower() == ".epub":
         attempt.post_processed_file_path = input_file_path
         attempt.save(update_fields=["post_processed_file_path"])
         return {
@@ -67,7 +120,7 @@ def convert_to_epub_for_attempt(attempt_id: UUID) -> dict[str, str | bool]:
             "message": f"File is already EPUB format: {input_file_path}",
         }
 
-    output_file_path = str(Path(input_file_path).with_suffix(".epub"))
+    output_file_path = str(input_path.with_suffix(".epub"))
 
     try:
         epub_path = convert_to_epub(
@@ -87,9 +140,7 @@ def convert_to_epub_for_attempt(attempt_id: UUID) -> dict[str, str | bool]:
 
 def organize_to_library_for_attempt(attempt_id: UUID) -> dict[str, str | bool]:
     try:
-        attempt = DownloadAttempt.objects.select_related("download_client").get(
-            id=attempt_id
-        )
+        attempt = _get_attempt(attempt_id)
     except DownloadAttempt.DoesNotExist:
         return {"success": False, "error": f"Download attempt {attempt_id} not found"}
 
@@ -105,32 +156,32 @@ def organize_to_library_for_attempt(attempt_id: UUID) -> dict[str, str | bool]:
         }
 
     file_to_organize: str | None = None
+    file_stat: os.stat_result | None = None
 
-    if attempt.post_processed_file_path and os.path.exists(
-        attempt.post_processed_file_path
-    ):
+    if (file_stat := _safe_stat(attempt.post_processed_file_path)) is not None:
         file_to_organize = attempt.post_processed_file_path
-        logger.info(f"Using post-processed file: {file_to_organize}")
-    elif attempt.raw_file_path and os.path.exists(attempt.raw_file_path):
+        logger.info("Using post-processed file: %s", file_to_organize)
+    elif (file_stat := _safe_stat(attempt.raw_file_path)) is not None:
         file_to_organize = attempt.raw_file_path
-        logger.info(f"Using raw file: {file_to_organize}")
+        logger.info("Using raw file: %s", file_to_organize)
     else:
         try:
-            file_to_organize = find_downloaded_file(
+            file_to_organize = _find_downloaded_file(
                 completed_downloads_path=config.completed_downloads_path,
                 release_title=attempt.release_title,
                 download_client_id=attempt.download_client_download_id,
             )
             attempt.raw_file_path = file_to_organize
             attempt.save(update_fields=["raw_file_path"])
-            logger.info(f"Found downloaded file: {file_to_organize}")
+            logger.info("Found downloaded file: %s", file_to_organize)
         except FileDiscoveryError as e:
             return {"success": False, "error": str(e)}
+        file_stat = _safe_stat(file_to_organize)
 
     author = media.authors[0] if media.authors else "Unknown Author"
 
     try:
-        if os.path.isdir(file_to_organize):
+        if file_stat is not None and stat.S_ISDIR(file_stat.st_mode):
             library_file_path = organize_directory_to_library(
                 source_dir_path=file_to_organize,
                 library_base_path=config.library_base_path,
@@ -144,19 +195,20 @@ def organize_to_library_for_attempt(attempt_id: UUID) -> dict[str, str | bool]:
                 author=author,
                 book_title=media.title,
             )
-        logger.info(f"File organized to library: {library_file_path}")
+        logger.info("File organized to library: %s", library_file_path)
     except FileOrganizerError as e:
         return {"success": False, "error": str(e)}
 
-    sanitized_title = Path(library_file_path).stem
-    library_dir = Path(library_file_path).parent
+    library_path = Path(library_file_path)
+    sanitized_title = library_path.stem
+    library_dir = library_path.parent
     opf_path = os.path.join(library_dir, f"{sanitized_title}.opf")
 
     try:
         generate_opf(media, opf_path)
-        logger.info(f"Generated OPF file: {opf_path}")
+        logger.info("Generated OPF file: %s", opf_path)
     except Exception as e:
-        logger.warning(f"Failed to generate OPF file: {str(e)}")
+        logger.warning("Failed to generate OPF file: %s", e)
 
     cover_path: str | None = None
     if media.cover_url:
@@ -164,9 +216,9 @@ def organize_to_library_for_attempt(attempt_id: UUID) -> dict[str, str | bool]:
         try:
             download_cover(media.cover_url, cover_output_path)
             cover_path = cover_output_path
-            logger.info(f"Downloaded cover to: {cover_path}")
+            logger.info("Downloaded cover to: %s", cover_path)
         except CoverDownloadError as e:
-            logger.warning(f"Failed to download cover: {str(e)}")
+            logger.warning("Failed to download cover: %s", e)
 
     media.library_path = library_file_path
     if cover_path:
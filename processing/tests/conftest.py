@@ -0,0 +1,68 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+from core.models_processing import ProcessingConfiguration
+from downloaders.models import DownloadAttempt, DownloadAttemptStatus
+from media.models import Book
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
+def book_content_type(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        return ContentType.objects.get_for_model(Book)
+
+
+@pytest.fixture
+def processing_config(db):
+    return ProcessingConfiguration.objects.create(
+        name="Test Config",
+        completed_downloads_path="/tmp/downloads",
+        library_base_path="/tmp/library",
+        calibre_ebook_convert_path="ebook-convert",
+        enabled=True,
+    )
+
+
+@pytest.fixture
+def book(db):
+    return Book.objects.create(
+        title="Test Book",
+        authors=["John Doe"],
+        description="A test book",
+        language="en",
+    )
+
+
+@pytest.fixture
+def download_attempt(db, book, processing_config, book_content_type):
+    return DownloadAttempt.objects.create(
+        content_type=book_content_type,
+        object_id=book.id,
+        indexer="TestIndexer",
+        indexer_id="1",
+        release_title="Test Book Release",
+        download_url="https://example.com/file.nzb",
+        status=DownloadAttemptStatus.DOWNLOADED,
+    )
+
+
+@pytest.fixture(scope="session")
+def tmp_base():
+    with tempfile.TemporaryDirectory(prefix="omnireadarr_processing_") as base:
+        yield Path(base)
+
+
+@pytest.fixture
+def work_dir(tmp_base):
+    return Path(tempfile.mkdtemp(dir=tmp_base))
@@ -1,58 +1,59 @@
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
-from django.contrib.contenttypes.models import ContentType
 
 from core.models_processing import ProcessingConfiguration
 from downloaders.models import DownloadAttempt, DownloadAttemptStatus
-from media.models import Book
+from processing.services import post_process
 from processing.services.post_process import (
     convert_to_epub_for_attempt,
     organize_to_library_for_attempt,
 )
+from processing.utils.cover_downloader import CoverDownloadError
 from processing.utils.ebook_converter import EbookConverterError
 from processing.utils.file_discovery import FileDiscoveryError
 from processing.utils.file_organizer import FileOrganizerError
 
 
-@pytest.fixture
-def processing_config(db):
-    return ProcessingConfiguration.objects.create(
-        name="Test Config",
-        completed_downloads_path="/tmp/downloads",
-        library_base_path="/tmp/library",
-        calibre_ebook_convert_path="ebook-convert",
-        enabled=True,
-    )
+def _raising(exc):
+    def stub(*args, **kwargs):
+        raise exc
 
+    return stub
 
-@pytest.fixture
-def book(db):
-    return Book.objects.create(
-        title="Test Book",
-        authors=["John Doe"],
-        description="A test book",
-        language="en",
+
+@pytest.fixture(scope="module")
+def shared_pp_mocks():
+    return SimpleNamespace(
+        find=MagicMock(),
+        convert=MagicMock(),
+        organize=MagicMock(),
+        organize_directory=MagicMock(),
     )
 
 
 @pytest.fixture
-def download_attempt(db, book, processing_config):
-    content_type = ContentType.objects.get_for_model(book)
-    return DownloadAttempt.objects.create(
-        content_type=content_type,
-        object_id=book.id,
-        indexer="TestIndexer",
-        indexer_id="1",
-        release_title="Test Book Release",
-        download_url="https://example.com/file.nzb",
-        status=DownloadAttemptStatus.DOWNLOADED,
+def pp_mocks(monkeypatch, shared_pp_mocks):
+    mocks = shared_pp_mocks
+    monkeypatch.setattr(post_process, "find_downloaded_file", mocks.find)
+    monkeypatch.setattr(post_process, "convert_to_epub", mocks.convert)
+    monkeypatch.setattr(post_process, "organize_to_library", mocks.organize)
+    monkeypatch.setattr(
+        post_process, "organize_directory_to_library", mocks.organize_directory
     )
+    monkeypatch.setattr(
+        post_process, "generate_opf", lambda media, output_path: output_path
+    )
+    monkeypatch.setattr(
+        post_process, "download_cover", lambda cover_url, output_path: output_path
+    )
+    yield mocks
+    for mock in vars(mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
 
 
 class TestConvertToEpubForAttempt:
@@ -74,55 +75,46 @@ class TestConvertToEpubForAttempt:
         assert isinstance(error, str)
         assert "No enabled processing configuration" in error
 
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.convert_to_epub")
     def test_convert_to_epub_success(
-        self, mock_convert, mock_find, download_attempt, processing_config
+        self, pp_mocks, download_attempt, processing_config, work_dir
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            input_file = Path(tmpdir) / "test.mobi"
-            input_file.write_text("test content")
-            output_file = Path(tmpdir) / "test.epub"
-            output_file.write_text("epub content")
-            
-            mock_find.return_value = str(input_file)
-            mock_convert.return_value = str(output_file)
-            
-            result = convert_to_epub_for_attempt(download_attempt.id)
-            
-            assert result["success"] is True
-            message = result.get("message")
-            assert isinstance(message, str)
-            assert "Successfully converted" in message
-            
-            download_attempt.refresh_from_db()
-            assert download_attempt.post_processed_file_path == str(output_file)
-
-    @patch("processing.services.post_process.find_downloaded_file")
+        input_file = work_dir / "test.mobi"
+        output_file = work_dir / "test.epub"
+        
+        pp_mocks.find.return_value = str(input_file)
+        pp_mocks.convert.return_value = str(output_file)
+        
+        result = convert_to_epub_for_attempt(download_attempt.id)
+        
+        assert result["success"] is True
+        message = result.get("message")
+        assert isinstance(message, str)
+        assert "Successfully converted" in message
+        
+        download_attempt.refresh_from_db(fields=["post_processed_file_path"])
+        assert download_attempt.post_processed_file_path == str(output_file)
+
     def test_convert_to_epub_already_epub(
-        self, mock_find, download_attempt, processing_config
+        self, pp_mocks, download_attempt, processing_config, work_dir
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            epub_file = Path(tmpdir) / "test.epub"
-            epub_file.write_text("epub content")
-            
-            mock_find.return_value = str(epub_file)
-            
-            result = convert_to_epub_for_attempt(download_attempt.id)
-            
-            assert result["success"] is True
-            message = result.get("message")
-            assert isinstance(message, str)
-            assert "already EPUB format" in message
-            
-            download_attempt.refresh_from_db()
-            assert download_attempt.post_processed_file_path == str(epub_file)
-
-    @patch("processing.services.post_process.find_downloaded_file")
+        epub_file = work_dir / "test.epub"
+        
+        pp_mocks.find.return_value = str(epub_file)
+        
+        result = convert_to_epub_for_attempt(download_attempt.id)
+        
+        assert result["success"] is True
+        message = result.get("message")
+        assert isinstance(message, str)
+        assert "already EPUB format" in message
+        
+        download_attempt.refresh_from_db(fields=["post_processed_file_path"])
+        assert download_attempt.post_processed_file_path == str(epub_file)
+
     def test_convert_to_epub_file_discovery_error(
-        self, mock_find, download_attempt, processing_config
+        self, pp_mocks, download_attempt, processing_config
     ):
-        mock_find.side_effect = FileDiscoveryError("File not found")
+        pp_mocks.find.side_effect = FileDiscoveryError("File not found")
         
         result = convert_to_epub_for_attempt(download_attempt.id)
         
@@ -131,40 +123,38 @@ class TestConvertToEpubForAttempt:
         assert isinstance(error, str)
         assert "File not found" in error
 
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.convert_to_epub")
     def test_convert_to_epub_conversion_error(
-        self, mock_convert, mock_find, download_attempt, processing_config
+        self, pp_mocks, download_attempt, processing_config, work_dir
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            input_file = Path(tmpdir) / "test.mobi"
-            input_file.write_text("test content")
-            
-            mock_find.return_value = str(input_file)
-            mock_convert.side_effect = EbookConverterError("Conversion failed")
-            
-            result = convert_to_epub_for_attempt(download_attempt.id)
-            
-            assert result["success"] is False
-            error = result.get("error")
-            assert isinstance(error, str)
-            assert "Conversion failed" in error
-
-    @patch("processing.services.post_process.find_downloaded_file")
-    def test_convert_to_epub_uses_existing_raw_file_path(
-        self, mock_find, download_attempt, processing_config
+        input_file = work_dir / "test.mobi"
+        
+        pp_mocks.find.return_value = str(input_file)
+        pp_mocks.convert.side_effect = EbookConverterError("Conversion failed")
+        
+        result = convert_to_epub_for_attempt(download_attempt.id)
+        
+        assert result["success"] is False
+        error = result.get("error")
+        assert isinstance(error, str)
+        assert "Conversion failed" in error
+
+    def test_convert_then_organize_sees_saved_paths(
+        self, pp_mocks, download_attempt, processing_config, work_dir
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            epub_file = Path(tmpdir) / "test.epub"
-            epub_file.write_text("epub content")
-            
-            download_attempt.raw_file_path = str(epub_file)
-            download_attempt.save()
-            
-            result = convert_to_epub_for_attempt(download_attempt.id)
-            
-            mock_find.assert_not_called()
-            assert result["success"] is True
+        epub_file = work_dir / "test.epub"
+        epub_file.write_text("epub content")
+        library_file = work_dir / "library" / "Test Book.epub"
+
+        pp_mocks.find.return_value = str(epub_file)
+        pp_mocks.organize.return_value = str(library_file)
+
+        convert_result = convert_to_epub_for_attempt(download_attempt.id)
+        organize_result = organize_to_library_for_attempt(download_attempt.id)
+
+        assert convert_result["success"] is True
+        assert organize_result["success"] is True
+        pp_mocks.find.assert_called_once()
+        assert pp_mocks.organize.call_args[1]["source_file_path"] == str(epub_file)
 
 
 class TestOrganizeToLibraryForAttempt:
@@ -177,10 +167,11 @@ class TestOrganizeToLibraryForAttempt:
         assert isinstance(error, str)
         assert "not found" in error.lower()
 
-    def test_organize_to_library_no_media(self, db, processing_config):
-        content_type = ContentType.objects.get_for_model(Book)
-        attempt = DownloadAttempt.objects.create(
-            content_type=content_type,
+    def test_organize_to_library_no_media(
+        self, db, processing_config, book_content_type
+    ):
+        attempt = DownloadAttempt(
+            content_type=book_content_type,
             object_id=uuid4(),
             indexer="TestIndexer",
             indexer_id="1",
@@ -188,6 +179,7 @@ class TestOrganizeToLibraryForAttempt:
             download_url="https://example.com/file.nzb",
             status=DownloadAttemptStatus.DOWNLOADED,
         )
+        DownloadAttempt.objects.bulk_create([attempt])
         
         result = organize_to_library_for_attempt(attempt.id)
         assert result["success"] is False
@@ -204,118 +196,77 @@ class TestOrganizeToLibraryForAttempt:
         assert isinstance(error, str)
         assert "No enabled processing configuration" in error
 
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.organize_to_library")
-    @patch("processing.services.post_process.generate_opf")
-    @patch("processing.services.post_process.download_cover")
     def test_organize_to_library_success(
-        self,
-        mock_download_cover,
-        mock_generate_opf,
-        mock_organize,
-        mock_find,
-        download_attempt,
-        book,
-        processing_config,
+        self, pp_mocks, download_attempt, book, processing_config, work_dir
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "test.epub"
-            source_file.write_text("test content")
-            
-            library_file = Path(tmpdir) / "library" / "John Doe" / "Test Book" / "Test Book.epub"
-            library_file.parent.mkdir(parents=True)
-            library_file.write_text("test content")
-            
-            opf_file = library_file.parent / "Test Book.opf"
-            cover_file = library_file.parent / "Test Book.jpg"
-            
-            mock_find.return_value = str(source_file)
-            mock_organize.return_value = str(library_file)
-            mock_generate_opf.return_value = str(opf_file)
-            mock_download_cover.return_value = str(cover_file)
-            
-            book.cover_url = "https://example.com/cover.jpg"
-            book.save()
-            
-            result = organize_to_library_for_attempt(download_attempt.id)
-            
-            assert result["success"] is True
-            message = result.get("message")
-            assert isinstance(message, str)
-            assert "Successfully organized" in message
-            
-            book.refresh_from_db()
-            assert book.library_path == str(library_file)
-            assert book.cover_path == str(cover_file)
-            
-            download_attempt.refresh_from_db()
-            assert download_attempt.post_processed_file_path == str(library_file)
-
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.organize_to_library")
-    @patch("processing.services.post_process.generate_opf")
-    def test_organize_to_library_uses_post_processed_file(
-        self,
-        mock_generate_opf,
-        mock_organize,
-        mock_find,
-        download_attempt,
-        book,
-        processing_config,
+        source_file = work_dir / "test.epub"
+        
+        library_file = work_dir / "library" / "John Doe" / "Test Book" / "Test Book.epub"
+        
+        cover_file = library_file.parent / "Test Book.jpg"
+        
+        pp_mocks.find.return_value = str(source_file)
+        pp_mocks.organize.return_value = str(library_file)
+        
+        book.cover_url = "https://example.com/cover.jpg"
+        book.save(update_fields=["cover_url"])
+        
+        result = organize_to_library_for_attempt(download_attempt.id)
+        
+        assert result["success"] is True
+        message = result.get("message")
+        assert isinstance(message, str)
+        assert "Successfully organized" in message
+        
+        book.refresh_from_db(fields=["library_path", "cover_path"])
+        assert book.library_path == str(library_file)
+        assert book.cover_path == str(cover_file)
+        
+        download_attempt.refresh_from_db(fields=["post_processed_file_path"])
+        assert download_attempt.post_processed_file_path == str(library_file)
+
+    def test_organize_to_library_reads_paths_written_elsewhere(
+        self, pp_mocks, download_attempt, book, processing_config, work_dir
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            epub_file = Path(tmpdir) / "test.epub"
-            epub_file.write_text("epub content")
-            
-            library_file = Path(tmpdir) / "library" / "John Doe" / "Test Book" / "Test Book.epub"
-            library_file.parent.mkdir(parents=True)
-            
-            download_attempt.post_processed_file_path = str(epub_file)
-            download_attempt.save()
-            
-            mock_organize.return_value = str(library_file)
-            mock_generate_opf.return_value = str(library_file.parent / "Test Book.opf")
-            
-            result = organize_to_library_for_attempt(download_attempt.id)
-            
-            mock_find.assert_not_called()
-            assert result["success"] is True
-
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.organize_to_library")
-    @patch("processing.services.post_process.generate_opf")
-    def test_organize_to_library_uses_raw_file_path(
-        self,
-        mock_generate_opf,
-        mock_organize,
-        mock_find,
-        download_attempt,
-        book,
-        processing_config,
+        old_file = work_dir / "old.epub"
+        old_file.write_text("old")
+        new_file = work_dir / "new.epub"
+        new_file.write_text("new")
+        attempts = DownloadAttempt.objects.filter(id=download_attempt.id)
+        attempts.update(raw_file_path=str(old_file))
+        pp_mocks.organize.side_effect = FileOrganizerError("Library unavailable")
+
+        organize_to_library_for_attempt(download_attempt.id)
+        attempts.update(raw_file_path=str(new_file))
+        pp_mocks.organize.side_effect = None
+        pp_mocks.organize.return_value = str(work_dir / "library.epub")
+        organize_to_library_for_attempt(download_attempt.id)
+
+        assert pp_mocks.organize.call_args[1]["source_file_path"] == str(new_file)
+
+    def test_organize_to_library_deleted_attempt_not_found(
+        self, pp_mocks, download_attempt, book, processing_config, work_dir
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            raw_file = Path(tmpdir) / "raw.epub"
-            raw_file.write_text("raw content")
-            
-            library_file = Path(tmpdir) / "library" / "John Doe" / "Test Book" / "Test Book.epub"
-            library_file.parent.mkdir(parents=True)
-            
-            download_attempt.raw_file_path = str(raw_file)
-            download_attempt.save()
-            
-            mock_organize.return_value = str(library_file)
-            mock_generate_opf.return_value = str(library_file.parent / "Test Book.opf")
-            
-            result = organize_to_library_for_attempt(download_attempt.id)
-            
-            mock_find.assert_not_called()
-            assert result["success"] is True
-
-    @patch("processing.services.post_process.find_downloaded_file")
+        source_file = work_dir / "test.epub"
+        source_file.write_text("epub content")
+        attempts = DownloadAttempt.objects.filter(id=download_attempt.id)
+        attempts.update(raw_file_path=str(source_file))
+        pp_mocks.organize.side_effect = FileOrganizerError("Library unavailable")
+
+        organize_to_library_for_attempt(download_attempt.id)
+        attempts.delete()
+        pp_mocks.organize.reset_mock(side_effect=True)
+
+        result = organize_to_library_for_attempt(download_attempt.id)
+
+        assert result["success"] is False
+        assert "not found" in str(result.get("error")).lower()
+        pp_mocks.organize.assert_not_called()
+
     def test_organize_to_library_file_discovery_error(
-        self, mock_find, download_attempt, book, processing_config
+        self, pp_mocks, download_attempt, book, processing_config
     ):
-        mock_find.side_effect = FileDiscoveryError("File not found")
+        pp_mocks.find.side_effect = FileDiscoveryError("File not found")
         
         result = organize_to_library_for_attempt(download_attempt.id)
         
@@ -324,156 +275,176 @@ class TestOrganizeToLibraryForAttempt:
         assert isinstance(error, str)
         assert "File not found" in error
 
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.organize_to_library")
+    def test_organize_to_library_file_discovery_miss_is_cached(
+        self, pp_mocks, download_attempt, book, processing_config
+    ):
+        pp_mocks.find.side_effect = FileDiscoveryError("File not found")
+
+        first = organize_to_library_for_attempt(download_attempt.id)
+        second = convert_to_epub_for_attempt(download_attempt.id)
+
+        assert first["success"] is False
+        assert second["success"] is False
+        assert second.get("error") == "File not found"
+        pp_mocks.find.assert_called_once()
+
     def test_organize_to_library_organization_error(
-        self, mock_organize, mock_find, download_attempt, book, processing_config
+        self, pp_mocks, download_attempt, book, processing_config, work_dir
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "test.epub"
-            source_file.write_text("test content")
-            
-            mock_find.return_value = str(source_file)
-            mock_organize.side_effect = FileOrganizerError("Organization failed")
-            
-            result = organize_to_library_for_attempt(download_attempt.id)
-            
-            assert result["success"] is False
-            error = result.get("error")
-            assert isinstance(error, str)
-            assert "Organization failed" in error
-
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.organize_to_library")
-    @patch("processing.services.post_process.generate_opf")
-    @patch("processing.services.post_process.download_cover")
+        source_file = work_dir / "test.epub"
+        
+        pp_mocks.find.return_value = str(source_file)
+        pp_mocks.organize.side_effect = FileOrganizerError("Organization failed")
+        
+        result = organize_to_library_for_attempt(download_attempt.id)
+        
+        assert result["success"] is False
+        error = result.get("error")
+        assert isinstance(error, str)
+        assert "Organization failed" in error
+
     def test_organize_to_library_opf_generation_fails_continues(
         self,
-        mock_download_cover,
-        mock_generate_opf,
-        mock_organize,
-        mock_find,
+        pp_mocks,
+        monkeypatch,
         download_attempt,
         book,
         processing_config,
+        work_dir,
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "test.epub"
-            source_file.write_text("test content")
-            
-            library_file = Path(tmpdir) / "library" / "John Doe" / "Test Book" / "Test Book.epub"
-            library_file.parent.mkdir(parents=True)
-            
-            mock_find.return_value = str(source_file)
-            mock_organize.return_value = str(library_file)
-            mock_generate_opf.side_effect = Exception("OPF generation failed")
-            
-            result = organize_to_library_for_attempt(download_attempt.id)
-            
-            assert result["success"] is True
-
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.organize_to_library")
-    @patch("processing.services.post_process.generate_opf")
-    @patch("processing.services.post_process.download_cover")
+        source_file = work_dir / "test.epub"
+        
+        library_file = work_dir / "library" / "John Doe" / "Test Book" / "Test Book.epub"
+        
+        pp_mocks.find.return_value = str(source_file)
+        pp_mocks.organize.return_value = str(library_file)
+        monkeypatch.setattr(
+            post_process, "generate_opf", _raising(Exception("OPF generation failed"))
+        )
+        
+        result = organize_to_library_for_attempt(download_attempt.id)
+        
+        assert result["success"] is True
+
     def test_organize_to_library_cover_download_fails_continues(
         self,
-        mock_download_cover,
-        mock_generate_opf,
-        mock_organize,
-        mock_find,
+        pp_mocks,
+        monkeypatch,
         download_attempt,
         book,
         processing_config,
+        work_dir,
     ):
-        from processing.utils.cover_downloader import CoverDownloadError
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "test.epub"
-            source_file.write_text("test content")
-            
-            library_file = Path(tmpdir) / "library" / "John Doe" / "Test Book" / "Test Book.epub"
-            library_file.parent.mkdir(parents=True)
-            
-            mock_find.return_value = str(source_file)
-            mock_organize.return_value = str(library_file)
-            mock_generate_opf.return_value = str(library_file.parent / "Test Book.opf")
-            mock_download_cover.side_effect = CoverDownloadError("Cover download failed")
-            
-            book.cover_url = "https://example.com/cover.jpg"
-            book.save()
-            
-            result = organize_to_library_for_attempt(download_attempt.id)
-            
-            assert result["success"] is True
-            
-            book.refresh_from_db()
-            assert book.library_path == str(library_file)
-            assert book.cover_path == ""
-
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.organize_to_library")
-    @patch("processing.services.post_process.generate_opf")
+        source_file = work_dir / "test.epub"
+        
+        library_file = work_dir / "library" / "John Doe" / "Test Book" / "Test Book.epub"
+        
+        pp_mocks.find.return_value = str(source_file)
+        pp_mocks.organize.return_value = str(library_file)
+        monkeypatch.setattr(
+            post_process,
+            "download_cover",
+            _raising(CoverDownloadError("Cover download failed")),
+        )
+        
+        book.cover_url = "https://example.com/cover.jpg"
+        book.save(update_fields=["cover_url"])
+        
+        result = organize_to_library_for_attempt(download_attempt.id)
+        
+        assert result["success"] is True
+        
+        book.refresh_from_db(fields=["library_path", "cover_path"])
+        assert book.library_path == str(library_file)
+        assert book.cover_path == ""
+
     def test_organize_to_library_no_cover_url(
-        self,
-        mock_generate_opf,
-        mock_organize,
-        mock_find,
-        download_attempt,
-        book,
-        processing_config,
+        self, pp_mocks, download_attempt, book, processing_config, work_dir
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "test.epub"
-            source_file.write_text("test content")
-            
-            library_file = Path(tmpdir) / "library" / "John Doe" / "Test Book" / "Test Book.epub"
-            library_file.parent.mkdir(parents=True)
-            
-            mock_find.return_value = str(source_file)
-            mock_organize.return_value = str(library_file)
-            mock_generate_opf.return_value = str(library_file.parent / "Test Book.opf")
-            
-            book.cover_url = ""
-            book.save()
-            
-            result = organize_to_library_for_attempt(download_attempt.id)
-            
-            assert result["success"] is True
-            
-            book.refresh_from_db()
-            assert book.cover_path == ""
-
-    @patch("processing.services.post_process.find_downloaded_file")
-    @patch("processing.services.post_process.organize_to_library")
-    @patch("processing.services.post_process.generate_opf")
+        source_file = work_dir / "test.epub"
+        
+        library_file = work_dir / "library" / "John Doe" / "Test Book" / "Test Book.epub"
+        
+        pp_mocks.find.return_value = str(source_file)
+        pp_mocks.organize.return_value = str(library_file)
+        
+        book.cover_url = ""
+        book.save(update_fields=["cover_url"])
+        
+        result = organize_to_library_for_attempt(download_attempt.id)
+        
+        assert result["success"] is True
+        
+        book.refresh_from_db(fields=["cover_path"])
+        assert book.cover_path == ""
+
     def test_organize_to_library_no_authors(
+        self, pp_mocks, download_attempt, book, processing_config, work_dir
+    ):
+        source_file = work_dir / "test.epub"
+        
+        library_file = work_dir / "library" / "Unknown Author" / "Test Book" / "Test Book.epub"
+        
+        book.authors = []
+        book.save(update_fields=["authors"])
+        
+        pp_mocks.find.return_value = str(source_file)
+        pp_mocks.organize.return_value = str(library_file)
+        
+        result = organize_to_library_for_attempt(download_attempt.id)
+        
+        assert result["success"] is True
+        pp_mocks.organize.assert_called_once()
+        call_args = pp_mocks.organize.call_args
+        assert call_args[1]["author"] == "Unknown Author"
+
+    def test_organize_to_library_directory_uses_directory_organizer(
+        self, pp_mocks, download_attempt, book, processing_config, work_dir
+    ):
+        audio_dir = work_dir / "Test Book Audio"
+        audio_dir.mkdir()
+
+        library_dir = work_dir / "library" / "John Doe" / "Test Book"
+
+        pp_mocks.find.return_value = str(audio_dir)
+        pp_mocks.organize_directory.return_value = str(library_dir)
+
+        result = organize_to_library_for_attempt(download_attempt.id)
+
+        assert result["success"] is True
+        pp_mocks.organize.assert_not_called()
+        pp_mocks.organize_directory.assert_called_once()
+
+
+class TestUsesExistingFilePath:
+    @pytest.mark.parametrize(
+        "process, attr_name",
+        [
+            (convert_to_epub_for_attempt, "raw_file_path"),
+            (organize_to_library_for_attempt, "post_processed_file_path"),
+            (organize_to_library_for_attempt, "raw_file_path"),
+        ],
+        ids=["convert-raw", "organize-post-processed", "organize-raw"],
+    )
+    def test_uses_existing_file_path(
         self,
-        mock_generate_opf,
-        mock_organize,
-        mock_find,
+        pp_mocks,
         download_attempt,
         book,
         processing_config,
+        work_dir,
+        process,
+        attr_name,
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "test.epub"
-            source_file.write_text("test content")
-            
-            library_file = Path(tmpdir) / "library" / "Unknown Author" / "Test Book" / "Test Book.epub"
-            library_file.parent.mkdir(parents=True)
-            
-            book.authors = []
-            book.save()
-            
-            mock_find.return_value = str(source_file)
-            mock_organize.return_value = str(library_file)
-            mock_generate_opf.return_value = str(library_file.parent / "Test Book.opf")
-            
-            result = organize_to_library_for_attempt(download_attempt.id)
-            
-            assert result["success"] is True
-            mock_organize.assert_called_once()
-            call_args = mock_organize.call_args
-            assert call_args[1]["author"] == "Unknown Author"
+        epub_file = work_dir / "test.epub"
+        epub_file.write_text("epub content")
+
+        setattr(download_attempt, attr_name, str(epub_file))
+        download_attempt.save(update_fields=[attr_name])
+
+        pp_mocks.organize.return_value = str(work_dir / "library" / "Test Book.epub")
+
+        result = process(download_attempt.id)
 
+        pp_mocks.find.assert_not_called()
+        assert result["success"] is True
@@ -1,146 +1,214 @@
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
+from processing.utils import cover_downloader
 from processing.utils.cover_downloader import CoverDownloadError, download_cover
 
 
 class TestCoverDownloader:
-    @patch("httpx.Client")
-    def test_download_cover_success(self, mock_client_class):
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    @patch("processing.utils.cover_downloader._get_client")
+    def test_download_cover_success(self, mock_get_client, tmp_path):
+        mock_client = mock_get_client.return_value
 
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "image/jpeg"}
-        mock_response.content = b"fake image data"
+        mock_response.iter_bytes.return_value = [b"fake image data"]
         mock_response.raise_for_status = MagicMock()
-        mock_client.get.return_value = mock_response
+        mock_client.stream.return_value.__enter__.return_value = mock_response
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "cover.jpg"
-            result = download_cover("https://example.com/cover.jpg", str(output_path))
+        output_path = tmp_path / "cover.jpg"
+        result = download_cover("https://example.com/cover.jpg", str(output_path))
 
-            assert result == str(output_path)
-            assert output_path.exists()
-            assert output_path.read_bytes() == b"fake image data"
+        assert result == str(output_path)
+        assert output_path.exists()
+        assert output_path.read_bytes() == b"fake image data"
 
-    @patch("httpx.Client")
-    def test_download_cover_creates_directory(self, mock_client_class):
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    @patch("processing.utils.cover_downloader._get_client")
+    def test_download_cover_creates_directory(self, mock_get_client, tmp_path):
+        mock_client = mock_get_client.return_value
 
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "image/jpeg"}
-        mock_response.content = b"fake image data"
+        mock_response.iter_bytes.return_value = [b"fake image data"]
         mock_response.raise_for_status = MagicMock()
-        mock_client.get.return_value = mock_response
+        mock_client.stream.return_value.__enter__.return_value = mock_response
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "subdir" / "cover.jpg"
-            download_cover("https://example.com/cover.jpg", str(output_path))
+        output_path = tmp_path / "subdir" / "cover.jpg"
+        download_cover("https://example.com/cover.jpg", str(output_path))
 
-            assert output_path.parent.exists()
+        assert output_path.parent.exists()
 
     @patch("httpx.Client")
-    def test_download_cover_follows_redirects(self, mock_client_class):
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    def test_download_cover_reuses_configured_client(
+        self, mock_client_class, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr(cover_downloader, "_client", None)
+        mock_client = mock_client_class.return_value
 
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "image/jpeg"}
-        mock_response.content = b"fake image data"
+        mock_response.iter_bytes.return_value = [b"fake image data"]
         mock_response.raise_for_status = MagicMock()
-        mock_client.get.return_value = mock_response
+        mock_client.stream.return_value.__enter__.return_value = mock_response
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "cover.jpg"
-            download_cover("https://example.com/cover.jpg", str(output_path))
+        output_path = tmp_path / "cover.jpg"
+        download_cover("https://example.com/cover.jpg", str(output_path))
+        download_cover("https://example.com/cover.jpg", str(output_path))
 
-            mock_client_class.assert_called_once()
-            call_kwargs = mock_client_class.call_args[1]
-            assert call_kwargs.get("follow_redirects") is True
+        mock_client_class.assert_called_once()
+        call_kwargs = mock_client_class.call_args[1]
+        assert call_kwargs.get("follow_redirects") is True
+        assert call_kwargs.get("http2") is True
+        assert mock_client.stream.call_count == 2
 
-    @patch("httpx.Client")
-    def test_download_cover_warns_on_unexpected_content_type(self, mock_client_class):
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    def test_get_client_creates_one_client_across_threads(self, monkeypatch):
+        monkeypatch.setattr(cover_downloader, "_client", None)
+        monkeypatch.setattr(cover_downloader.atexit, "register", MagicMock())
+
+        def slow_client(**kwargs):
+            time.sleep(0.05)
+            return MagicMock()
+
+        client_class = MagicMock(side_effect=slow_client)
+        monkeypatch.setattr(cover_downloader.httpx, "Client", client_class)
+
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def worker():
+            barrier.wait()
+            clients.append(cover_downloader._get_client())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        client_class.assert_called_once()
+        assert all(client is clients[0] for client in clients)
+
+    @patch("processing.utils.cover_downloader._get_client")
+    def test_download_cover_warns_on_unexpected_content_type(
+        self, mock_get_client, tmp_path
+    ):
+        mock_client = mock_get_client.return_value
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/octet-stream"}
+        mock_response.iter_bytes.return_value = [b"\xff\xd8\xff\xe0", b"jpeg data"]
+        mock_response.raise_for_status = MagicMock()
+        mock_client.stream.return_value.__enter__.return_value = mock_response
+
+        output_path = tmp_path / "cover.jpg"
+        result = download_cover("https://example.com/cover.jpg", str(output_path))
+
+        assert result == str(output_path)
+        assert output_path.read_bytes() == b"\xff\xd8\xff\xe0jpeg data"
+
+    @patch("processing.utils.cover_downloader._get_client")
+    def test_download_cover_rejects_non_image_body(self, mock_get_client, tmp_path):
+        mock_client = mock_get_client.return_value
 
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "text/html"}
-        mock_response.content = b"fake image data"
+        mock_response.iter_bytes.return_value = [b"<html>not found</html>"]
+        mock_response.raise_for_status = MagicMock()
+        mock_client.stream.return_value.__enter__.return_value = mock_response
+
+        output_path = tmp_path / "cover.jpg"
+        with pytest.raises(CoverDownloadError) as exc_info:
+            download_cover("https://example.com/cover.jpg", str(output_path))
+
+        assert str(exc_info.value) == (
+            "Cover response is not an image (content type: text/html)"
+        )
+
+        assert not output_path.exists()
+
+    @patch("processing.utils.cover_downloader._get_client")
+    def test_download_cover_interrupted_keeps_existing_cover(
+        self, mock_get_client, tmp_path
+    ):
+        mock_client = mock_get_client.return_value
+
+        def interrupted_body():
+            yield b"\xff\xd8\xff\xe0partial"
+            raise httpx.ReadError("Connection reset")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "image/jpeg"}
+        mock_response.iter_bytes.return_value = interrupted_body()
         mock_response.raise_for_status = MagicMock()
-        mock_client.get.return_value = mock_response
+        mock_client.stream.return_value.__enter__.return_value = mock_response
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "cover.jpg"
-            result = download_cover("https://example.com/cover.jpg", str(output_path))
+        output_path = tmp_path / "cover.jpg"
+        output_path.write_bytes(b"good cover")
+        with pytest.raises(CoverDownloadError, match="Connection reset"):
+            download_cover("https://example.com/cover.jpg", str(output_path))
 
-            assert result == str(output_path)
+        assert output_path.read_bytes() == b"good cover"
+        assert list(tmp_path.iterdir()) == [output_path]
 
-    @patch("httpx.Client")
-    def test_download_cover_empty_url(self, mock_client_class):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "cover.jpg"
-            with pytest.raises(CoverDownloadError, match="Cover URL is empty"):
-                download_cover("", str(output_path))
+    @patch("processing.utils.cover_downloader._get_client")
+    def test_download_cover_empty_url(self, mock_get_client, tmp_path):
+        output_path = tmp_path / "cover.jpg"
+        with pytest.raises(CoverDownloadError, match="Cover URL is empty"):
+            download_cover("", str(output_path))
 
-    @patch("httpx.Client")
-    def test_download_cover_http_error(self, mock_client_class):
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    @patch("processing.utils.cover_downloader._get_client")
+    def test_download_cover_http_error(self, mock_get_client, tmp_path):
+        mock_client = mock_get_client.return_value
 
         mock_response = MagicMock()
         mock_response.status_code = 404
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Not Found", request=MagicMock(), response=mock_response
         )
-        mock_client.get.return_value = mock_response
+        mock_client.stream.return_value.__enter__.return_value = mock_response
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "cover.jpg"
-            with pytest.raises(CoverDownloadError, match="HTTP error"):
-                download_cover("https://example.com/cover.jpg", str(output_path))
+        output_path = tmp_path / "cover.jpg"
+        with pytest.raises(CoverDownloadError, match="HTTP error"):
+            download_cover("https://example.com/cover.jpg", str(output_path))
 
-    @patch("httpx.Client")
-    def test_download_cover_timeout(self, mock_client_class):
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    @patch("processing.utils.cover_downloader._get_client")
+    def test_download_cover_timeout(self, mock_get_client, tmp_path):
+        mock_client = mock_get_client.return_value
 
-        mock_client.get.side_effect = httpx.TimeoutException("Request timed out")
+        mock_client.stream.side_effect = httpx.TimeoutException("Request timed out")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "cover.jpg"
-            with pytest.raises(CoverDownloadError, match="Timeout"):
-                download_cover(
-                    "https://example.com/cover.jpg", str(output_path), timeout=10
-                )
+        output_path = tmp_path / "cover.jpg"
+        with pytest.raises(CoverDownloadError, match="Timeout"):
+            download_cover(
+                "https://example.com/cover.jpg", str(output_path), timeout=10
+            )
 
-    @patch("httpx.Client")
-    def test_download_cover_file_not_written(self, mock_client_class):
-        mock_client = MagicMock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+    @patch("processing.utils.cover_downloader._get_client")
+    def test_download_cover_file_not_written(self, mock_get_client, tmp_path):
+        mock_client = mock_get_client.return_value
 
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "image/jpeg"}
-        mock_response.content = b"fake image data"
+        mock_response.iter_bytes.return_value = [b"fake image data"]
         mock_response.raise_for_status = MagicMock()
-        mock_client.get.return_value = mock_response
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "nonexistent" / "cover.jpg"
-            with patch("builtins.open", side_effect=OSError("Permission denied")):
-                with pytest.raises(
-                    CoverDownloadError, match="Failed to download cover"
-                ):
-                    download_cover("https://example.com/cover.jpg", str(output_path))
+        mock_client.stream.return_value.__enter__.return_value = mock_response
+
+        output_path = tmp_path / "nonexistent" / "cover.jpg"
+        with patch("builtins.open", side_effect=OSError("Permission denied")):
+            with pytest.raises(
+                CoverDownloadError, match="Failed to download cover"
+            ):
+                download_cover("https://example.com/cover.jpg", str(output_path))
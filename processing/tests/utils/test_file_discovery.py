@@ -5,7 +5,10 @@ from pathlib import Path
 
 import pytest
 
-from processing.utils.file_discovery import FileDiscoveryError, find_downloaded_file
+from processing.utils.file_discovery import (
+    FileDiscoveryError,
+    find_downloaded_file,
+)
 
 
 class TestFileDiscovery:
@@ -114,3 +117,80 @@ class TestFileDiscovery:
                     release_title="Nonexistent Book",
                 )
 
+
+    def test_find_downloaded_file_audio_by_title_substring(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            other_dir = Path(tmpdir) / "misc"
+            other_dir.mkdir()
+            for i in range(3):
+                (other_dir / f"track{i}.mp3").write_text("audio")
+            book_dir = Path(tmpdir) / "download"
+            book_dir.mkdir()
+            (book_dir / "hobbit_track01.mp3").write_text("audio")
+
+            result = find_downloaded_file(
+                completed_downloads_path=tmpdir,
+                release_title="The Hobbit Unabridged",
+            )
+
+            assert result == str(book_dir)
+
+    def test_find_downloaded_file_prefers_client_id_over_title(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "Some Title.epub").write_text("test content")
+            subdir = Path(tmpdir) / "nested"
+            subdir.mkdir()
+            client_file = subdir / "release_SABnzbd_nzo_abc123.epub"
+            client_file.write_text("test content")
+
+            result = find_downloaded_file(
+                completed_downloads_path=tmpdir,
+                release_title="Some Title",
+                download_client_id="SABnzbd_nzo_abc123",
+            )
+
+            assert result == str(client_file)
+
+    def test_find_downloaded_file_sees_removed_match(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("one", "two"):
+                (Path(tmpdir) / name).mkdir()
+                (Path(tmpdir) / name / "Test Book Release.epub").write_text("test")
+
+            first = find_downloaded_file(tmpdir, "Test Book Release")
+            Path(first).unlink()
+            second = find_downloaded_file(tmpdir, "Test Book Release")
+
+            assert second != first
+            assert Path(second).exists()
+
+    def test_find_downloaded_file_sees_file_added_after_miss(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            subdir = Path(tmpdir) / "incoming"
+            subdir.mkdir()
+            (Path(tmpdir) / "Other Book.epub").write_text("test")
+
+            assert find_downloaded_file(tmpdir, "Other Book")
+            with pytest.raises(FileDiscoveryError):
+                find_downloaded_file(tmpdir, "Test Book Release")
+
+            late_file = subdir / "Test Book Release.epub"
+            late_file.write_text("test")
+
+            assert find_downloaded_file(tmpdir, "Test Book Release") == str(late_file)
+
+    def test_find_downloaded_file_sees_file_added_to_existing_subdir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            audio_dir = Path(tmpdir) / "audio" / "Other_Book"
+            audio_dir.mkdir(parents=True)
+            for name in ("01.mp3", "02.mp3"):
+                (audio_dir / name).write_text("audio")
+            ebooks_dir = Path(tmpdir) / "ebooks"
+            ebooks_dir.mkdir()
+
+            assert find_downloaded_file(tmpdir, "Dune Messiah") == str(audio_dir)
+
+            epub = ebooks_dir / "Dune Messiah.epub"
+            epub.write_text("test")
+
+            assert find_downloaded_file(tmpdir, "Dune Messiah") == str(epub)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -8,6 +8,7 @@ import pytest
 from processing.utils.file_organizer import (
     FileOrganizerError,
     get_library_path,
+    organize_directory_to_library,
     organize_to_library,
     sanitize_filename,
 )
@@ -75,146 +76,320 @@ class TestGetLibraryPath:
 
 
 class TestOrganizeToLibrary:
-    def test_organize_to_library_success(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.epub"
-            source_file.write_text("test content")
-            
-            library_base = Path(tmpdir) / "library"
-            library_base.mkdir()
-            
-            result = organize_to_library(
-                str(source_file),
-                str(library_base),
-                "John Doe",
-                "Test Book",
-            )
-            
-            expected_path = library_base / "John Doe" / "Test Book" / "Test Book.epub"
-            assert result == str(expected_path)
-            assert expected_path.exists()
-            assert expected_path.read_text() == "test content"
-
-    def test_organize_to_library_creates_directories(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.epub"
-            source_file.write_text("test content")
-            
-            library_base = Path(tmpdir) / "library"
-            library_base.mkdir()
-            
+    def test_organize_to_library_success(self, tmp_path):
+        source_file = tmp_path / "source.epub"
+        source_file.write_text("test content")
+
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        result = organize_to_library(
+            str(source_file),
+            str(library_base),
+            "John Doe",
+            "Test Book",
+        )
+
+        expected_path = library_base / "John Doe" / "Test Book" / "Test Book.epub"
+        assert result == str(expected_path)
+        assert expected_path.exists()
+        assert expected_path.read_text() == "test content"
+
+    def test_organize_to_library_creates_directories(self, tmp_path):
+        source_file = tmp_path / "source.epub"
+        source_file.write_text("test content")
+
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        organize_to_library(
+            str(source_file),
+            str(library_base),
+            "John Doe",
+            "Test Book",
+        )
+
+        assert (library_base / "John Doe" / "Test Book").exists()
+
+    def test_organize_to_library_sanitizes_names(self, tmp_path):
+        source_file = tmp_path / "source.epub"
+        source_file.write_text("test content")
+
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        result = organize_to_library(
+            str(source_file),
+            str(library_base),
+            "John/Doe",
+            "Test:Book",
+        )
+
+        expected_path = library_base / "John_Doe" / "Test_Book" / "Test_Book.epub"
+        assert result == str(expected_path)
+
+    def test_organize_to_library_preserves_extension(self, tmp_path):
+        source_file = tmp_path / "source.mobi"
+        source_file.write_text("test content")
+
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        result = organize_to_library(
+            str(source_file),
+            str(library_base),
+            "John Doe",
+            "Test Book",
+        )
+
+        assert result.endswith(".mobi")
+
+    def test_organize_to_library_source_not_exists(self, tmp_path):
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        with pytest.raises(FileOrganizerError, match="does not exist"):
             organize_to_library(
-                str(source_file),
+                "/nonexistent/file.epub",
                 str(library_base),
                 "John Doe",
                 "Test Book",
             )
-            
-            assert (library_base / "John Doe" / "Test Book").exists()
-
-    def test_organize_to_library_sanitizes_names(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.epub"
-            source_file.write_text("test content")
-            
-            library_base = Path(tmpdir) / "library"
-            library_base.mkdir()
-            
-            result = organize_to_library(
-                str(source_file),
-                str(library_base),
-                "John/Doe",
-                "Test:Book",
-            )
-            
-            expected_path = library_base / "John_Doe" / "Test_Book" / "Test_Book.epub"
-            assert result == str(expected_path)
-
-    def test_organize_to_library_preserves_extension(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.mobi"
-            source_file.write_text("test content")
-            
-            library_base = Path(tmpdir) / "library"
-            library_base.mkdir()
-            
-            result = organize_to_library(
+
+    def test_organize_to_library_base_not_exists(self, tmp_path):
+        source_file = tmp_path / "source.epub"
+        source_file.write_text("test content")
+
+        with pytest.raises(FileOrganizerError, match="does not exist"):
+            organize_to_library(
                 str(source_file),
-                str(library_base),
+                "/nonexistent/library",
                 "John Doe",
                 "Test Book",
             )
-            
-            assert result.endswith(".mobi")
-
-    def test_organize_to_library_source_not_exists(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            library_base = Path(tmpdir) / "library"
-            library_base.mkdir()
-            
-            with pytest.raises(FileOrganizerError, match="does not exist"):
-                organize_to_library(
-                    "/nonexistent/file.epub",
-                    str(library_base),
-                    "John Doe",
-                    "Test Book",
-                )
 
-    def test_organize_to_library_base_not_exists(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.epub"
-            source_file.write_text("test content")
-            
-            with pytest.raises(FileOrganizerError, match="does not exist"):
+    def test_organize_to_library_base_not_directory(self, tmp_path):
+        source_file = tmp_path / "source.epub"
+        source_file.write_text("test content")
+
+        fake_file = tmp_path / "fake_file"
+        fake_file.write_text("fake")
+
+        with pytest.raises((FileOrganizerError, NotADirectoryError)):
+            try:
                 organize_to_library(
                     str(source_file),
-                    "/nonexistent/library",
+                    str(fake_file),
                     "John Doe",
                     "Test Book",
                 )
-
-    def test_organize_to_library_base_not_directory(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.epub"
-            source_file.write_text("test content")
-            
-            fake_file = Path(tmpdir) / "fake_file"
-            fake_file.write_text("fake")
-            
-            with pytest.raises((FileOrganizerError, NotADirectoryError)):
-                try:
-                    organize_to_library(
-                        str(source_file),
-                        str(fake_file),
-                        "John Doe",
-                        "Test Book",
-                    )
-                except FileOrganizerError as e:
-                    if "does not exist" in str(e) or "not a directory" in str(e):
-                        raise
-                    raise FileOrganizerError("Expected error")
-                except NotADirectoryError:
+            except FileOrganizerError as e:
+                if "does not exist" in str(e) or "not a directory" in str(e):
                     raise
+                raise FileOrganizerError("Expected error")
+            except NotADirectoryError:
+                raise
 
-    def test_organize_to_library_same_file_already_exists(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_file = Path(tmpdir) / "source.epub"
-            source_file.write_text("test content")
-            
-            library_base = Path(tmpdir) / "library"
-            library_base.mkdir()
-            dest_dir = library_base / "John Doe" / "Test Book"
-            dest_dir.mkdir(parents=True)
-            dest_file = dest_dir / "Test Book.epub"
-            dest_file.write_text("existing content")
-            
-            result = organize_to_library(
-                str(source_file),
-                str(library_base),
-                "John Doe",
-                "Test Book",
-            )
-            
-            assert result == str(dest_file)
-            assert dest_file.read_text() == "test content"
+    def test_organize_to_library_same_file_already_exists(self, tmp_path):
+        source_file = tmp_path / "source.epub"
+        source_file.write_text("test content")
 
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+        dest_dir = library_base / "John Doe" / "Test Book"
+        dest_dir.mkdir(parents=True)
+        dest_file = dest_dir / "Test Book.epub"
+        dest_file.write_text("existing content")
+
+        result = organize_to_library(
+            str(source_file),
+            str(library_base),
+            "John Doe",
+            "Test Book",
+        )
+
+        assert result == str(dest_file)
+        assert dest_file.read_text() == "test content"
+
+
+    @pytest.mark.parametrize("mode, shares_inode", [("link", True), ("copy", False)])
+    def test_organize_to_library_placement_mode(self, mode, shares_inode, tmp_path):
+        source_file = tmp_path / "source.epub"
+        source_file.write_text("test content")
+
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        result = organize_to_library(
+            str(source_file),
+            str(library_base),
+            "John Doe",
+            "Test Book",
+            mode=mode,
+        )
+
+        assert Path(result).read_text() == "test content"
+        assert Path(result).samefile(source_file) is shares_inode
+
+    @pytest.mark.parametrize(
+        "failing_calls",
+        [("copy_file_range",), ("copy_file_range", "sendfile")],
+        ids=["sendfile", "buffered"],
+    )
+    def test_organize_to_library_copy_fallbacks(
+        self, monkeypatch, tmp_path, failing_calls
+    ):
+        def fail(*args):
+            raise OSError("not supported")
+
+        for name in failing_calls:
+            monkeypatch.setattr(os, name, fail, raising=False)
+        source_file = tmp_path / "source.epub"
+        source_file.write_bytes(b"x" * (3 * 1024 * 1024 + 7))
+        os.utime(source_file, (1_000_000, 1_000_000))
+
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        result = organize_to_library(
+            str(source_file),
+            str(library_base),
+            "John Doe",
+            "Test Book",
+            mode="copy",
+        )
+
+        assert Path(result).read_bytes() == source_file.read_bytes()
+        assert Path(result).stat().st_mtime == 1_000_000
+
+    @pytest.mark.parametrize(
+        "stalled_calls",
+        [("copy_file_range",), ("copy_file_range", "sendfile")],
+        ids=["sendfile", "buffered"],
+    )
+    def test_organize_to_library_copy_without_progress_falls_back(
+        self, monkeypatch, tmp_path, stalled_calls
+    ):
+        def no_progress(*args):
+            return 0
+
+        for name in stalled_calls:
+            monkeypatch.setattr(os, name, no_progress, raising=False)
+        source_file = tmp_path / "source.epub"
+        source_file.write_bytes(b"x" * (1024 * 1024))
+
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        result = organize_to_library(
+            str(source_file),
+            str(library_base),
+            "John Doe",
+            "Test Book",
+            mode="copy",
+        )
+
+        assert Path(result).read_bytes() == source_file.read_bytes()
+
+    @pytest.mark.parametrize("mode", ["link", "copy"])
+    def test_organize_to_library_rerun_keeps_linked_file(self, tmp_path, mode):
+        source_file = tmp_path / "source.epub"
+        source_file.write_text("test content")
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+        first = organize_to_library(
+            str(source_file), str(library_base), "John Doe", "Test Book"
+        )
+
+        second = organize_to_library(
+            str(source_file), str(library_base), "John Doe", "Test Book", mode=mode
+        )
+
+        assert second == first
+        assert Path(second).samefile(source_file)
+        assert source_file.read_text() == "test content"
+
+    def test_organize_to_library_link_replaces_existing_without_touching_it(
+        self, tmp_path
+    ):
+        source_file = tmp_path / "source.epub"
+        source_file.write_text("new content")
+        other_file = tmp_path / "other.epub"
+        other_file.write_text("other content")
+
+        library_base = tmp_path / "library"
+        dest_dir = library_base / "John Doe" / "Test Book"
+        dest_dir.mkdir(parents=True)
+        dest_file = dest_dir / "Test Book.epub"
+        dest_file.hardlink_to(other_file)
+
+        organize_to_library(
+            str(source_file), str(library_base), "John Doe", "Test Book"
+        )
+
+        assert dest_file.read_text() == "new content"
+        assert other_file.read_text() == "other content"
+
+
+class TestOrganizeDirectoryToLibrary:
+    @pytest.mark.parametrize("mode", ["link", "copy"])
+    def test_organize_directory_places_nested_audio_files(self, tmp_path, mode):
+        source_dir = tmp_path / "download"
+        (source_dir / "cd2").mkdir(parents=True)
+        for name in ("01.mp3", "02.MP3"):
+            (source_dir / name).write_text(name)
+        (source_dir / "cd2" / "03.m4b").write_text("03.m4b")
+        (source_dir / "notes.nfo").write_text("nfo")
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        result = organize_directory_to_library(
+            str(source_dir), str(library_base), "John Doe", "Test Book", mode=mode
+        )
+
+        library_dir = library_base / "John Doe" / "Test Book"
+        assert result == str(library_dir)
+        assert sorted(p.name for p in library_dir.iterdir()) == [
+            "01.mp3",
+            "02.MP3",
+            "03.m4b",
+        ]
+        assert (library_dir / "03.m4b").read_text() == "03.m4b"
+
+    def test_organize_directory_skips_unreadable_subdirectory(
+        self, monkeypatch, tmp_path
+    ):
+        source_dir = tmp_path / "download"
+        unreadable_dir = source_dir / "locked"
+        unreadable_dir.mkdir(parents=True)
+        (source_dir / "01.mp3").write_text("01.mp3")
+        (unreadable_dir / "02.mp3").write_text("02.mp3")
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == str(unreadable_dir):
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+
+        result = organize_directory_to_library(
+            str(source_dir), str(library_base), "John Doe", "Test Book"
+        )
+
+        assert [p.name for p in Path(result).iterdir()] == ["01.mp3"]
+
+    def test_organize_directory_without_audio_files(self, tmp_path):
+        source_dir = tmp_path / "download"
+        source_dir.mkdir()
+        (source_dir / "book.epub").write_text("epub")
+        library_base = tmp_path / "library"
+        library_base.mkdir()
+
+        with pytest.raises(FileOrganizerError, match="No audio files found"):
+            organize_directory_to_library(
+                str(source_dir), str(library_base), "John Doe", "Test Book"
+            )
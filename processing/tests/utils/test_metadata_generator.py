@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import tempfile
+import xml.etree.ElementTree as ET
 from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -190,3 +191,30 @@ class TestGenerateOpf:
             
             assert opf_path.exists()
 
+    def test_generate_opf_is_well_formed_xml(self):
+        media = MagicMock()
+        media.title = "Cats & <Dogs>"
+        media.language = "en"
+        media.isbn = "1234567890"
+        media.isbn13 = None
+        media.authors = ["Doe, John"]
+        media.description = ""
+        media.publication_date = None
+        media.publisher = ""
+        media.genres = []
+        media.cover_path = "/path/to/cover.jpg"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            opf_path = Path(tmpdir) / "test.opf"
+            generate_opf(media, str(opf_path))
+
+            root = ET.parse(opf_path).getroot()
+            dc = "{http://purl.org/dc/elements/1.1/}"
+            opf = "{http://www.idpf.org/2007/opf}"
+            assert root.tag == f"{opf}package"
+            assert root.find(f"{opf}metadata/{dc}title").text == "Cats & <Dogs>"
+            creator = root.find(f"{opf}metadata/{dc}creator")
+            assert creator.get(f"{opf}role") == "aut"
+            assert creator.get(f"{opf}file-as") == "Doe, John"
+            reference = root.find(f"{opf}guide/{opf}reference")
+            assert reference.get("href") == "cover.jpg"
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import threading
 from pathlib import Path
 
 import httpx
@@ -13,6 +15,72 @@ class CoverDownloadError(Exception):
     pass
 
 
+STREAM_CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+PARTIAL_SUFFIX = ".part"
+
+CONNECT_TIMEOUT = 5.0
+
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30
+)
+_CLIENT_HEADERS = {"User-Agent": "OmniReadarr/1.0"}
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                client = httpx.Client(
+                    http2=True,
+                    follow_redirects=True,
+                    limits=_CLIENT_LIMITS,
+                    headers=_CLIENT_HEADERS,
+                )
+                atexit.register(client.close)
+                _client = client
+    return _client
+
+
+def _timeout(timeout: int) -> httpx.Timeout:
+    return httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+
+
+def _has_image_signature(head: bytes) -> bool:
+    return head.startswith((b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n", b"GIF8")) or (
+        head[:4] == b"RIFF" and head[8:12] == b"WEBP"
+    )
+
+
+def _check_cover_body(content_type: str, head: bytes) -> None:
+    looks_like_image = _has_image_signature(head)
+    if not content_type.startswith("image/"):
+        if not looks_like_image:
+            raise CoverDownloadError(
+                f"Cover response is not an image (content type: {content_type})"
+            )
+        logger.warning(
+            f"Unexpected content type for cover: {content_type}. "
+            f"Body looks like an image, proceeding anyway."
+        )
+    elif not looks_like_image:
+        logger.warning(
+            f"Cover body does not start with a known image signature "
+            f"(content type: {content_type}). Proceeding anyway."
+        )
+
+
+def _discard_partial(partial_path: str) -> None:
+    try:
+        os.unlink(partial_path)
+    except FileNotFoundError:
+        pass
+
+
 def download_cover(cover_url: str, output_path: str, timeout: int = 10) -> str:
     if not cover_url:
         raise CoverDownloadError("Cover URL is empty")
@@ -23,25 +91,31 @@ def download_cover(cover_url: str, output_path: str, timeout: int = 10) -> str:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(cover_url)
+        with _get_client().stream(
+            "GET", cover_url, timeout=_timeout(timeout)
+        ) as response:
             response.raise_for_status()
 
-            content_type = response.headers.get("Content-Type", "")
-            if not content_type.startswith("image/"):
-                logger.warning(
-                    f"Unexpected content type for cover: {content_type}. "
-                    f"Proceeding anyway."
-                )
+            chunks = iter(response.iter_bytes(chunk_size=STREAM_CHUNK_SIZE))
+            head = next(chunks, b"")
+            _check_cover_body(response.headers.get("Content-Type", ""), head)
 
-            with open(output_path, "wb") as f:
-                f.write(response.content)
+            partial_path = f"{output_path}{PARTIAL_SUFFIX}"
+            try:
+                with open(partial_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                    f.write(head)
+                    for chunk in chunks:
+                        f.write(chunk)
+                os.replace(partial_path, output_path)
+            except BaseException:
+                _discard_partial(partial_path)
+                raise
 
-            if not os.path.exists(output_path):
-                raise CoverDownloadError(f"Cover file was not written to {output_path}")
+        if not os.path.exists(output_path):
+            raise CoverDownloadError(f"Cover file was not written to {output_path}")
 
-            logger.info(f"Successfully downloaded cover to {output_path}")
-            return output_path
+        logger.info(f"Successfully downloaded cover to {output_path}")
+        return output_path
 
     except httpx.HTTPStatusError as e:
         raise CoverDownloadError(
@@ -49,5 +123,7 @@ def download_cover(cover_url: str, output_path: str, timeout: int = 10) -> str:
         )
     except httpx.TimeoutException:
         raise CoverDownloadError(f"Timeout downloading cover after {timeout} seconds")
+    except CoverDownloadError:
+        raise
     except Exception as e:
         raise CoverDownloadError(f"Failed to download cover: {str(e)}")
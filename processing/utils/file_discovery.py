@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +13,249 @@ class FileDiscoveryError(Exception):
     pass
 
 
+_EBOOK_EXTENSIONS = (
+    ".epub",
+    ".mobi",
+    ".azw",
+    ".azw3",
+    ".pdf",
+    ".txt",
+    ".rtf",
+    ".fb2",
+    ".lit",
+)
+_AUDIO_EXTENSIONS = (
+    ".mp3",
+    ".m4a",
+    ".m4b",
+    ".flac",
+    ".ogg",
+    ".wav",
+    ".aac",
+    ".opus",
+)
+_TITLE_STOPWORDS = frozenset(
+    {"the", "a", "an", "and", "or", "of", "in", "on", "at", "to", "for"}
+)
+_FILE_STOPWORDS = frozenset(
+    {
+        "ch",
+        "chapter",
+        "part",
+        "ep",
+        "episode",
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "of",
+    }
+)
+
+_SPLIT_RE = re.compile(r"[._\-\s]+")
+
+
+@dataclass(slots=True)
+class DirBucket:
+    root: str
+    ebook_files: tuple[tuple[str, str], ...]
+    audio_files: tuple[tuple[str, str], ...]
+    root_words: tuple[str, ...]
+
+
+@dataclass(slots=True)
+class ReleaseTitle:
+    lower: str
+    words: list[str]
+    match_words: list[str]
+    substring_re: re.Pattern[str] | None
+
+    @classmethod
+    def from_title(cls, release_title: str) -> ReleaseTitle:
+        lower = release_title.lower()
+        words = [
+            word
+            for word in lower.split()
+            if word not in _TITLE_STOPWORDS and not word.isdigit() and len(word) > 2
+        ]
+        substring_words = [word for word in words[:3] if len(word) > 3]
+        substring_re = (
+            re.compile("|".join(map(re.escape, substring_words)))
+            if substring_words
+            else None
+        )
+        return cls(
+            lower=lower,
+            words=words,
+            match_words=words[:5],
+            substring_re=substring_re,
+        )
+
+
+def _significant_words(name_lower: str) -> list[str]:
+    return [
+        w
+        for w in _SPLIT_RE.split(name_lower)
+        if w not in _FILE_STOPWORDS and not w.isdigit() and len(w) > 2
+    ]
+
+
+def _walk_files(path: str) -> Iterator[tuple[str, list[os.DirEntry[str]]]]:
+    files: list[os.DirEntry[str]] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    files.append(entry)
+    except OSError as e:
+        logger.warning(f"Skipping unreadable directory {path}: {e}")
+        return
+
+    yield path, files
+    for subdir in subdirs:
+        yield from _walk_files(subdir)
+
+
+def _build_bucket(root: str, entries: list[os.DirEntry[str]]) -> DirBucket:
+    ebook_files: list[tuple[str, str]] = []
+    audio_files: list[tuple[str, str]] = []
+    for entry in entries:
+        file_lower = entry.name.lower()
+        if file_lower.endswith(_EBOOK_EXTENSIONS):
+            ebook_files.append((entry.path, file_lower))
+        elif file_lower.endswith(_AUDIO_EXTENSIONS):
+            audio_files.append((entry.path, file_lower))
+
+    return DirBucket(
+        root=root,
+        ebook_files=tuple(ebook_files),
+        audio_files=tuple(audio_files),
+        root_words=tuple(_significant_words(os.path.basename(root).lower()))
+        if audio_files
+        else (),
+    )
+
+
+def _scan(path: str) -> tuple[DirBucket, ...]:
+    return tuple(_build_bucket(root, entries) for root, entries in _walk_files(path))
+
+
+def _matches_at_least_two(words: list[str], word_set: set[str]) -> bool:
+    matches = 0
+    for word in words:
+        if word in word_set:
+            matches += 1
+            if matches >= 2:
+                return True
+    return False
+
+
+def _match_by_download_client_id(
+    bucket: DirBucket, download_client_id_lower: str
+) -> str | None:
+    for file_path, file_lower in bucket.ebook_files:
+        if download_client_id_lower in file_lower:
+            logger.info(f"Found ebook file matching download_client_id: {file_path}")
+            return file_path
+
+    for _, file_lower in bucket.audio_files:
+        if download_client_id_lower in file_lower:
+            logger.info(
+                f"Found audio directory matching download_client_id: {bucket.root}"
+            )
+            return bucket.root
+
+    return None
+
+
+def _match_ebook_by_title(bucket: DirBucket, title: ReleaseTitle) -> str | None:
+    for file_path, file_lower in bucket.ebook_files:
+        if title.lower in file_lower:
+            logger.info(f"Found ebook file matching release_title: {file_path}")
+            return file_path
+    return None
+
+
+def _audio_file_matches(file_lower: str, title: ReleaseTitle) -> bool:
+    if title.lower in file_lower:
+        return True
+
+    if len(title.words) >= 2:
+        file_words = _significant_words(file_lower)
+        if len(file_words) >= 2 and _matches_at_least_two(
+            title.match_words, set(file_words)
+        ):
+            return True
+
+    return title.substring_re is not None and bool(
+        title.substring_re.search(file_lower)
+    )
+
+
+def _match_audio_by_title(bucket: DirBucket, title: ReleaseTitle) -> str | None:
+    matching_count = sum(
+        1
+        for _, file_lower in bucket.audio_files
+        if _audio_file_matches(file_lower, title)
+    )
+    if matching_count:
+        logger.info(
+            f"Found audio directory with {matching_count} matching files "
+            f"(out of {len(bucket.audio_files)} total) in: {bucket.root}"
+        )
+        return bucket.root
+
+    if (
+        len(title.words) >= 2
+        and len(bucket.root_words) >= 2
+        and _matches_at_least_two(title.match_words, set(bucket.root_words))
+    ):
+        logger.info(
+            f"Found audio directory matching release_title by directory name: "
+            f"{bucket.root}"
+        )
+        return bucket.root
+
+    return None
+
+
+def _find_match(
+    scanned: tuple[DirBucket, ...],
+    release_title: str,
+    download_client_id: str | None,
+) -> str | None:
+    if download_client_id:
+        download_client_id_lower = download_client_id.lower()
+        for bucket in scanned:
+            match = _match_by_download_client_id(bucket, download_client_id_lower)
+            if match is not None:
+                return match
+
+    title = ReleaseTitle.from_title(release_title)
+    for bucket in scanned:
+        match = _match_ebook_by_title(bucket, title)
+        if match is None and bucket.audio_files:
+            match = _match_audio_by_title(bucket, title)
+        if match is not None:
+            return match
+
+    audio_buckets = [bucket for bucket in scanned if bucket.audio_files]
+    if audio_buckets:
+        best_match = max(audio_buckets, key=lambda b: len(b.audio_files))
+        logger.info(
+            f"Found audio directory with {len(best_match.audio_files)} audio files "
+            f"(assuming audiobook with multiple chapters): {best_match.root}"
+        )
+        return best_match.root
+
+    return None
+
+
 def find_downloaded_file(
     completed_downloads_path: str,
     release_title: str,
@@ -30,209 +276,18 @@ def find_downloaded_file(
         f"release_title: {release_title}, download_client_id: {download_client_id}"
     )
 
-    all_audio_dirs: list[tuple[str, int]] = []
-    all_ebook_files: list[str] = []
-
-    ebook_extensions = [
-        ".epub",
-        ".mobi",
-        ".azw",
-        ".azw3",
-        ".pdf",
-        ".txt",
-        ".rtf",
-        ".fb2",
-        ".lit",
-    ]
-    audio_extensions = [
-        ".mp3",
-        ".m4a",
-        ".m4b",
-        ".flac",
-        ".ogg",
-        ".wav",
-        ".aac",
-        ".opus",
-    ]
-
-    release_title_lower = release_title.lower()
-    release_title_words = release_title_lower.split()
-
-    for root, dirs, files in os.walk(completed_downloads_path):
-        audio_files_in_dir = []
-        ebook_files_in_dir = []
-
-        for file in files:
-            file_path = os.path.join(root, file)
-            file_lower = file.lower()
-
-            is_ebook = any(file_lower.endswith(ext) for ext in ebook_extensions)
-            is_audio = any(file_lower.endswith(ext) for ext in audio_extensions)
-
-            if is_ebook:
-                ebook_files_in_dir.append((file_path, file_lower))
-            elif is_audio:
-                audio_files_in_dir.append((file_path, file_lower))
-
-        if download_client_id:
-            download_client_id_lower = download_client_id.lower()
-            for file_path, file_lower in ebook_files_in_dir:
-                if download_client_id_lower in file_lower:
-                    logger.info(
-                        f"Found ebook file matching download_client_id: {file_path}"
-                    )
-                    return file_path
-
-            for file_path, file_lower in audio_files_in_dir:
-                if download_client_id_lower in file_lower:
-                    logger.info(
-                        f"Found audio directory matching download_client_id: {root}"
-                    )
-                    return root
-
-        for file_path, file_lower in ebook_files_in_dir:
-            all_ebook_files.append(file_path)
-            if release_title_lower in file_lower:
-                logger.info(f"Found ebook file matching release_title: {file_path}")
-                return file_path
-
-        if audio_files_in_dir:
-            release_title_words_filtered = [
-                word
-                for word in release_title_words
-                if word
-                not in [
-                    "the",
-                    "a",
-                    "an",
-                    "and",
-                    "or",
-                    "of",
-                    "in",
-                    "on",
-                    "at",
-                    "to",
-                    "for",
-                ]
-                and not word.isdigit()
-                and len(word) > 2
-            ]
-
-            matching_audio_files = []
-            for file_path, file_lower in audio_files_in_dir:
-                if release_title_lower in file_lower:
-                    matching_audio_files.append(file_path)
-                    continue
-
-                file_words = (
-                    file_lower.replace(".", " ")
-                    .replace("_", " ")
-                    .replace("-", " ")
-                    .split()
-                )
-                file_words_filtered = [
-                    w
-                    for w in file_words
-                    if w
-                    not in [
-                        "ch",
-                        "chapter",
-                        "part",
-                        "ep",
-                        "episode",
-                        "the",
-                        "a",
-                        "an",
-                        "and",
-                        "or",
-                        "of",
-                    ]
-                    and not w.isdigit()
-                    and len(w) > 2
-                ]
-
-                if (
-                    len(release_title_words_filtered) >= 2
-                    and len(file_words_filtered) >= 2
-                ):
-                    matches = sum(
-                        1
-                        for word in release_title_words_filtered[:5]
-                        if word in file_words_filtered
-                    )
-                    if matches >= 2:
-                        matching_audio_files.append(file_path)
-                        continue
-
-                if len(release_title_words_filtered) >= 1:
-                    for title_word in release_title_words_filtered[:3]:
-                        if len(title_word) > 3 and title_word in file_lower:
-                            matching_audio_files.append(file_path)
-                            break
-
-            if matching_audio_files:
-                logger.info(
-                    f"Found audio directory with {len(matching_audio_files)} matching files "
-                    f"(out of {len(audio_files_in_dir)} total) in: {root}"
-                )
-                return root
-
-            root_name_lower = os.path.basename(root).lower()
-            root_words = (
-                root_name_lower.replace(".", " ")
-                .replace("_", " ")
-                .replace("-", " ")
-                .split()
-            )
-            root_words_filtered = [
-                w
-                for w in root_words
-                if w
-                not in [
-                    "ch",
-                    "chapter",
-                    "part",
-                    "ep",
-                    "episode",
-                    "the",
-                    "a",
-                    "an",
-                    "and",
-                    "or",
-                    "of",
-                ]
-                and not w.isdigit()
-                and len(w) > 2
-            ]
-
-            if len(release_title_words_filtered) >= 2 and len(root_words_filtered) >= 2:
-                matches = sum(
-                    1
-                    for word in release_title_words_filtered[:5]
-                    if word in root_words_filtered
-                )
-                if matches >= 2:
-                    logger.info(
-                        f"Found audio directory matching release_title by directory name: {root}"
-                    )
-                    return root
-
-            if len(audio_files_in_dir) >= 1:
-                all_audio_dirs.append((root, len(audio_files_in_dir)))
-
-    if all_audio_dirs:
-        best_match = max(all_audio_dirs, key=lambda x: x[1])
-        logger.info(
-            f"Found audio directory with {best_match[1]} audio files "
-            f"(assuming audiobook with multiple chapters): {best_match[0]}"
-        )
-        return best_match[0]
+    scanned = _scan(completed_downloads_path)
+    match = _find_match(scanned, release_title, download_client_id)
+    if match is not None:
+        return match
 
+    audio_buckets = [bucket for bucket in scanned if bucket.audio_files]
+    ebook_count = sum(len(bucket.ebook_files) for bucket in scanned)
     logger.warning(
         f"No matching files found. Searched in: {completed_downloads_path}, "
         f"release_title: {release_title}, download_client_id: {download_client_id}. "
-        f"Found {len(all_audio_dirs)} directories with audio files, "
-        f"{len(all_ebook_files)} ebook files total."
+        f"Found {len(audio_buckets)} directories with audio files, "
+        f"{ebook_count} ebook files total."
     )
 
     raise FileDiscoveryError(
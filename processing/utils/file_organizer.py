@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
 import shutil
-from pathlib import Path
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import BinaryIO, Literal
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +17,27 @@ class FileOrganizerError(Exception):
     pass
 
 
+PlacementMode = Literal["link", "copy"]
+
+COPY_BUFFER_SIZE = 1024 * 1024
+SMALL_FILE_SIZE = 256 * 1024
+PLACEMENT_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+_AUDIO_EXTENSIONS = (".mp3", ".m4a", ".m4b", ".flac", ".ogg", ".wav", ".aac", ".opus")
+
+
+_INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+_WHITESPACE_RE = re.compile(r"\s+")
+_NEEDS_SANITIZING_RE = re.compile(r'[<>:"/\\|?*]|\s{2,}|[^\S ]|^[\s.]|[\s.]$')
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(name: str, max_length: int = 200) -> str:
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, "_", name)
-    sanitized = re.sub(r"\s+", " ", sanitized)
+    if name and len(name) <= max_length and not _NEEDS_SANITIZING_RE.search(name):
+        return name
+
+    sanitized = name.translate(_INVALID_CHARS_TABLE)
+    sanitized = _WHITESPACE_RE.sub(" ", sanitized)
     sanitized = sanitized.strip()
     sanitized = sanitized.strip(".")
     
@@ -29,6 +50,114 @@ def sanitize_filename(name: str, max_length: int = 200) -> str:
     return sanitized
 
 
+def _copy_file_range(src_fd: int, dst_fd: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count)
+
+
+def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+
+_KERNEL_COPIERS = (_copy_file_range, _sendfile)
+
+
+def _kernel_copy(src: BinaryIO, dst: BinaryIO, size: int) -> bool:
+    for copier in _KERNEL_COPIERS:
+        remaining = size
+        try:
+            while remaining > 0:
+                copied = copier(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError) as e:
+            logger.debug(f"{copier.__name__} failed for {dst.name}: {e}")
+        else:
+            if remaining == 0:
+                return True
+            logger.debug(
+                f"{copier.__name__} stopped with {remaining} bytes left for {dst.name}"
+            )
+        src.seek(0)
+        dst.seek(0)
+        dst.truncate()
+    return False
+
+
+def _copy_file(source_path: str, dest_path: str) -> None:
+    with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        if size < SMALL_FILE_SIZE:
+            dst.write(src.read())
+        elif not _kernel_copy(src, dst, size):
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+    shutil.copystat(source_path, dest_path)
+
+
+def _is_same_file(source_path: str, dest_path: str) -> bool:
+    try:
+        return os.path.samefile(source_path, dest_path)
+    except OSError:
+        return False
+
+
+def _raise_if_same_file(source_path: str, dest_path: str) -> None:
+    if _is_same_file(source_path, dest_path):
+        raise shutil.SameFileError(f"{source_path} and {dest_path} are the same file")
+
+
+def _link_file(source_path: str, dest_path: str) -> None:
+    try:
+        os.link(source_path, dest_path)
+    except FileExistsError:
+        _raise_if_same_file(source_path, dest_path)
+        os.unlink(dest_path)
+        os.link(source_path, dest_path)
+
+
+def _place_file(source_path: str, dest_path: str, mode: PlacementMode) -> bool:
+    if mode == "link":
+        try:
+            _link_file(source_path, dest_path)
+            return True
+        except shutil.SameFileError:
+            raise
+        except OSError as e:
+            logger.debug(f"Hardlink to {dest_path} failed, copying instead: {e}")
+
+    _raise_if_same_file(source_path, dest_path)
+    _copy_file(source_path, dest_path)
+    return False
+
+
+def _place_new_file(
+    source_path: str, dest_path: str, mode: PlacementMode
+) -> bool | None:
+    try:
+        return _place_file(source_path, dest_path, mode)
+    except shutil.SameFileError:
+        return None
+
+
+def _iter_files(root: str) -> Iterator[os.DirEntry[str]]:
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        files: list[os.DirEntry[str]] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {path}: {e}")
+            continue
+        yield from files
+
+
 def get_library_path(
     library_base_path: str, author: str, book_title: str
 ) -> tuple[str, str]:
@@ -44,6 +173,7 @@ def organize_to_library(
     library_base_path: str,
     author: str,
     book_title: str,
+    mode: PlacementMode = "link",
 ) -> str:
     if not os.path.exists(source_file_path):
         raise FileOrganizerError(f"Source file does not exist: {source_file_path}")
@@ -64,16 +194,15 @@ def organize_to_library(
     
     os.makedirs(library_dir, exist_ok=True)
     
-    source_ext = Path(source_file_path).suffix
-    dest_filename = f"{sanitized_title}{source_ext}"
-    dest_path = os.path.join(library_dir, dest_filename)
+    source_ext = os.path.splitext(source_file_path)[1]
+    dest_path = os.path.join(library_dir, sanitized_title + source_ext)
     
-    if os.path.exists(dest_path) and os.path.samefile(source_file_path, dest_path):
+    linked = _place_new_file(source_file_path, dest_path, mode)
+    if linked is None:
         logger.info(f"File already at destination: {dest_path}")
         return dest_path
     
-    shutil.copy2(source_file_path, dest_path)
-    logger.info(f"Copied file to library: {dest_path}")
+    logger.info(f"{'Linked' if linked else 'Copied'} file to library: {dest_path}")
     
     return dest_path
 
@@ -83,6 +212,7 @@ def organize_directory_to_library(
     library_base_path: str,
     author: str,
     book_title: str,
+    mode: PlacementMode = "link",
 ) -> str:
     if not os.path.exists(source_dir_path):
         raise FileOrganizerError(f"Source directory does not exist: {source_dir_path}")
@@ -106,29 +236,39 @@ def organize_directory_to_library(
     
     os.makedirs(library_dir, exist_ok=True)
     
-    audio_extensions = [".mp3", ".m4a", ".m4b", ".flac", ".ogg", ".wav", ".aac", ".opus"]
-    files_copied = 0
-    
-    for root, dirs, files in os.walk(source_dir_path):
-        for file in files:
-            file_lower = file.lower()
-            if any(file_lower.endswith(ext) for ext in audio_extensions):
-                source_file = os.path.join(root, file)
-                dest_file = os.path.join(library_dir, file)
-                
-                if os.path.exists(dest_file) and os.path.samefile(source_file, dest_file):
-                    continue
-                
-                shutil.copy2(source_file, dest_file)
-                files_copied += 1
-                logger.info(f"Copied audio file to library: {dest_file}")
-    
-    if files_copied == 0:
+    placements: dict[str, str] = {}
+    
+    for entry in _iter_files(source_dir_path):
+        if entry.name.lower().endswith(_AUDIO_EXTENSIONS):
+            placements[os.path.join(library_dir, entry.name)] = entry.path
+    
+    if not placements:
         raise FileOrganizerError(
             f"No audio files found in source directory: {source_dir_path}"
         )
     
-    logger.info(f"Copied {files_copied} audio files to library: {library_dir}")
+    with ThreadPoolExecutor(
+        max_workers=min(PLACEMENT_WORKERS, len(placements))
+    ) as executor:
+        results = list(
+            executor.map(
+                _place_new_file, placements.values(), placements.keys(), repeat(mode)
+            )
+        )
+    
+    linked = [result for result in results if result is not None]
+    if not linked:
+        raise FileOrganizerError(
+            f"No audio files found in source directory: {source_dir_path}"
+        )
     
+    files_linked = sum(linked)
+    logger.info(
+        f"Placed {len(linked)} audio files in library ({files_linked} linked, "
+        f"{len(linked) - files_linked} copied): {library_dir}"
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Library audio files: {', '.join(placements)}")
+
     return library_dir
 
@@ -1,12 +1,32 @@
 from __future__ import annotations
 
 import logging
-import xml.etree.ElementTree as ET
+import os
 from datetime import date
-from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_OPF_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<package xmlns="http://www.idpf.org/2007/opf" version="2.0">\n'
+    '    <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" '
+    'xmlns:opf="http://www.idpf.org/2007/opf">\n'
+    "{metadata}"
+    "    </metadata>\n"
+    "{guide}"
+    "</package>\n"
+)
+_DC_ELEMENT_TEMPLATE = "        <dc:{tag}{attributes}>{text}</dc:{tag}>\n"
+_COVER_GUIDE_TEMPLATE = (
+    "    <guide>\n"
+    '        <reference href="{href}" type="cover" title="Cover" />\n'
+    "    </guide>\n"
+)
+_EMPTY_GUIDE = "    <guide />\n"
+_XML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"}
+)
+
 
 class MetadataGeneratorError(Exception):
     pass
@@ -15,116 +35,83 @@ class MetadataGeneratorError(Exception):
 def escape_xml_text(text: str) -> str:
     if not text:
         return ""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
+    return text.translate(_XML_ESCAPE_TABLE)
+
+
+def _dc_element(
+    tag: str, text: str, attributes: tuple[tuple[str, str], ...] = ()
+) -> str:
+    rendered_attributes = "".join(
+        f' {name}="{escape_xml_text(value)}"' for name, value in attributes
+    )
+    return _DC_ELEMENT_TEMPLATE.format(
+        tag=tag, attributes=rendered_attributes, text=escape_xml_text(text)
     )
 
 
 def generate_opf(media, output_path: str) -> str:
-    package = ET.Element("package")
-    package.set("version", "2.0")
-    package.set("xmlns", "http://www.idpf.org/2007/opf")
-    
-    metadata = ET.SubElement(package, "metadata")
-    metadata.set("xmlns:dc", "http://purl.org/dc/elements/1.1/")
-    metadata.set("xmlns:opf", "http://www.idpf.org/2007/opf")
-    
-    title_elem = ET.SubElement(metadata, "{http://purl.org/dc/elements/1.1/}title")
-    title_elem.text = media.title
-    
+    metadata: list[str] = [_dc_element("title", media.title)]
+
     if media.language:
-        language_elem = ET.SubElement(
-            metadata, "{http://purl.org/dc/elements/1.1/}language"
-        )
-        language_elem.text = media.language
-    
+        metadata.append(_dc_element("language", media.language))
+
     if hasattr(media, "isbn") and media.isbn:
-        identifier_elem = ET.SubElement(
-            metadata, "{http://purl.org/dc/elements/1.1/}identifier"
-        )
-        identifier_elem.set(
-            "{http://www.idpf.org/2007/opf}scheme", "ISBN"
+        metadata.append(
+            _dc_element("identifier", media.isbn, (("opf:scheme", "ISBN"),))
         )
-        identifier_elem.text = media.isbn
     elif hasattr(media, "isbn13") and media.isbn13:
-        identifier_elem = ET.SubElement(
-            metadata, "{http://purl.org/dc/elements/1.1/}identifier"
-        )
-        identifier_elem.set(
-            "{http://www.idpf.org/2007/opf}scheme", "ISBN"
+        metadata.append(
+            _dc_element("identifier", media.isbn13, (("opf:scheme", "ISBN"),))
         )
-        identifier_elem.text = media.isbn13
-    
+
     if media.authors:
         for author in media.authors:
-            creator_elem = ET.SubElement(
-                metadata, "{http://purl.org/dc/elements/1.1/}creator"
-            )
-            creator_elem.set("{http://www.idpf.org/2007/opf}role", "aut")
-            
             if ", " in author:
                 parts = author.split(", ", 1)
-                creator_elem.set(
-                    "{http://www.idpf.org/2007/opf}file-as", author
+                metadata.append(
+                    _dc_element(
+                        "creator",
+                        f"{parts[1]} {parts[0]}",
+                        (("opf:role", "aut"), ("opf:file-as", author)),
+                    )
                 )
-                creator_elem.text = f"{parts[1]} {parts[0]}"
             else:
-                creator_elem.text = author
-    
+                metadata.append(
+                    _dc_element("creator", author, (("opf:role", "aut"),))
+                )
+
     if media.description:
-        description_elem = ET.SubElement(
-            metadata, "{http://purl.org/dc/elements/1.1/}description"
-        )
-        description_elem.text = escape_xml_text(media.description)
-    
+        metadata.append(_dc_element("description", media.description))
+
     if media.publication_date:
-        date_elem = ET.SubElement(
-            metadata, "{http://purl.org/dc/elements/1.1/}date"
-        )
         if isinstance(media.publication_date, date):
-            date_elem.text = media.publication_date.isoformat()
+            publication_date = media.publication_date.isoformat()
         else:
-            date_elem.text = str(media.publication_date)
-    
+            publication_date = str(media.publication_date)
+        metadata.append(_dc_element("date", publication_date))
+
     if media.publisher:
-        publisher_elem = ET.SubElement(
-            metadata, "{http://purl.org/dc/elements/1.1/}publisher"
-        )
-        publisher_elem.text = media.publisher
-    
+        metadata.append(_dc_element("publisher", media.publisher))
+
     if media.genres:
         for genre in media.genres:
-            subject_elem = ET.SubElement(
-                metadata, "{http://purl.org/dc/elements/1.1/}subject"
-            )
-            subject_elem.text = genre
-    
-    guide = ET.SubElement(package, "guide")
+            metadata.append(_dc_element("subject", genre))
+
     if media.cover_path:
-        cover_filename = Path(media.cover_path).name
-        reference_elem = ET.SubElement(guide, "reference")
-        reference_elem.set("href", cover_filename)
-        reference_elem.set("type", "cover")
-        reference_elem.set("title", "Cover")
-    
-    tree = ET.ElementTree(package)
-    try:
-        ET.indent(tree, space="    ")
-    except AttributeError:
-        pass
-    
-    output_dir = Path(output_path).parent
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    tree.write(
-        output_path,
-        encoding="UTF-8",
-        xml_declaration=True,
+        guide = _COVER_GUIDE_TEMPLATE.format(
+            href=escape_xml_text(os.path.basename(media.cover_path))
+        )
+    else:
+        guide = _EMPTY_GUIDE
+
+    data = _OPF_TEMPLATE.format(metadata="".join(metadata), guide=guide).encode(
+        "utf-8"
     )
-    
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    with open(output_path, "wb") as f:
+        f.write(data)
+
     logger.info(f"Generated OPF file: {output_path}")
     return output_path
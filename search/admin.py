@@ -1,3 +1,9 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
 from django.contrib import admin
 from django.contrib import messages
 from django.shortcuts import redirect, render
@@ -6,6 +12,67 @@ from django.utils import timezone
 
 from search.models import ProviderType, SearchProvider
 from search.providers.registry import get_provider_instance
+from search.providers.results import NormalizedMetadata
+from search.tasks import check_provider_connection, run_connection_test
+
+
+ADMIN_TEST_WORKERS = 8
+
+TEST_SEARCH_QUERY = "python programming"
+TEST_SEARCH_MEDIA_TYPE = "book"
+
+PROVIDER_CHECK_FIELDS = (
+    "pk",
+    "name",
+    "provider_type",
+    "api_key",
+    "base_url",
+    "enabled",
+    "rate_limit_per_minute",
+    "config",
+    "updated_at",
+    "last_checked_at",
+    "last_error",
+)
+
+T = TypeVar("T")
+
+
+def _check_search(
+    provider: SearchProvider,
+) -> tuple[list[NormalizedMetadata], str | None]:
+    try:
+        results = get_provider_instance(provider).search(
+            TEST_SEARCH_QUERY,
+            TEST_SEARCH_MEDIA_TYPE,
+            language=None,
+            title=None,
+            author=None,
+        )
+        return results, None
+    except Exception as e:
+        return [], str(e)
+
+
+def _run_concurrently(
+    check: Callable[[SearchProvider], T], providers: Iterable[SearchProvider]
+) -> list[tuple[SearchProvider, T]]:
+    providers = list(providers)
+    if not providers:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(ADMIN_TEST_WORKERS, len(providers))
+    ) as executor:
+        return list(zip(providers, executor.map(check, providers)))
+
+
+def _save_check_results(
+    succeeded: list[SearchProvider], failed: list[SearchProvider]
+) -> None:
+    if succeeded:
+        SearchProvider.objects.bulk_update(succeeded, ["last_checked_at", "last_error"])
+    if failed:
+        SearchProvider.objects.bulk_update(failed, ["last_error"])
 
 
 @admin.register(SearchProvider)
@@ -67,73 +134,68 @@ class SearchProviderAdmin(admin.ModelAdmin):
 
     @admin.action(description="Test connection for selected providers")
     def test_connection(self, request, queryset):
-        for provider in queryset:
-            try:
-                provider_instance = get_provider_instance(provider)
-                if provider_instance.test_connection():
-                    provider.last_checked_at = timezone.now()
-                    provider.last_error = ""
-                    provider.save(update_fields=["last_checked_at", "last_error"])
-                    self.message_user(
-                        request,
-                        f"✓ {provider.name}: Connection successful",
-                        messages.SUCCESS,
-                    )
-                else:
-                    provider.last_error = "Connection test failed"
-                    provider.save(update_fields=["last_error"])
-                    self.message_user(
-                        request,
-                        f"✗ {provider.name}: Connection test failed",
-                        messages.ERROR,
-                    )
-            except Exception as e:
-                provider.last_error = str(e)
-                provider.save(update_fields=["last_error"])
+        checked = _run_concurrently(
+            check_provider_connection, queryset.only(*PROVIDER_CHECK_FIELDS)
+        )
+        succeeded, failed = [], []
+        for provider, error in checked:
+            if error is None:
+                provider.last_checked_at = timezone.now()
+                provider.last_error = ""
+                succeeded.append(provider)
+                self.message_user(
+                    request,
+                    f"✓ {provider.name}: Connection successful",
+                    messages.SUCCESS,
+                )
+            else:
+                provider.last_error = error
+                failed.append(provider)
                 self.message_user(
                     request,
-                    f"✗ {provider.name}: {str(e)}",
+                    f"✗ {provider.name}: {error}",
                     messages.ERROR,
                 )
 
+        _save_check_results(succeeded, failed)
+
     @admin.action(description="Test search for selected providers")
     def test_search(self, request, queryset):
-        test_query = "python programming"
-        test_media_type = "book"
-
-        for provider in queryset:
-            try:
-                provider_instance = get_provider_instance(provider)
-                results = provider_instance.search(
-                    test_query, test_media_type, language=None, title=None, author=None
+        checked = _run_concurrently(
+            _check_search, queryset.only(*PROVIDER_CHECK_FIELDS)
+        )
+        succeeded, failed = [], []
+        for provider, (results, error) in checked:
+            if error is not None:
+                provider.last_error = error
+                failed.append(provider)
+                self.message_user(
+                    request,
+                    f"✗ {provider.name}: {error}",
+                    messages.ERROR,
                 )
+                continue
 
-                provider.last_checked_at = timezone.now()
-                provider.last_error = ""
-                provider.save(update_fields=["last_checked_at", "last_error"])
-
-                if results:
-                    result_preview = results[0]
-                    self.message_user(
-                        request,
-                        f"✓ {provider.name}: Found {len(results)} results. "
-                        f"First result: '{result_preview.title}' by {', '.join(result_preview.authors) if result_preview.authors else 'Unknown'}",
-                        messages.SUCCESS,
-                    )
-                else:
-                    self.message_user(
-                        request,
-                        f"⚠ {provider.name}: Search successful but no results found",
-                        messages.WARNING,
-                    )
-            except Exception as e:
-                provider.last_error = str(e)
-                provider.save(update_fields=["last_error"])
+            provider.last_checked_at = timezone.now()
+            provider.last_error = ""
+            succeeded.append(provider)
+
+            if results:
+                result_preview = results[0]
                 self.message_user(
                     request,
-                    f"✗ {provider.name}: {str(e)}",
-                    messages.ERROR,
+                    f"✓ {provider.name}: Found {len(results)} results. "
+                    f"First result: '{result_preview.title}' by {result_preview.authors_display or 'Unknown'}",
+                    messages.SUCCESS,
                 )
+            else:
+                self.message_user(
+                    request,
+                    f"⚠ {provider.name}: Search successful but no results found",
+                    messages.WARNING,
+                )
+
+        _save_check_results(succeeded, failed)
 
     def get_urls(self):
         urls = super().get_urls()
@@ -163,21 +225,12 @@ class SearchProviderAdmin(admin.ModelAdmin):
             messages.error(request, "Provider not found")
             return redirect("admin:search_searchprovider_changelist")
 
-        try:
-            provider_instance = get_provider_instance(provider)
-            if provider_instance.test_connection():
-                provider.last_checked_at = timezone.now()
-                provider.last_error = ""
-                provider.save(update_fields=["last_checked_at", "last_error"])
-                messages.success(request, f"✓ {provider.name}: Connection successful")
-            else:
-                provider.last_error = "Connection test failed"
-                provider.save(update_fields=["last_error"])
-                messages.error(request, f"✗ {provider.name}: Connection test failed")
-        except Exception as e:
-            provider.last_error = str(e)
-            provider.save(update_fields=["last_error"])
-            messages.error(request, f"✗ {provider.name}: {str(e)}")
+        run_connection_test.send(str(provider.pk))
+        messages.info(
+            request,
+            f"Connection test for {provider.name} queued. "
+            f"Refresh to see the result under Status.",
+        )
 
         return redirect("admin:search_searchprovider_change", object_id)
 
@@ -199,6 +252,7 @@ class SearchProviderAdmin(admin.ModelAdmin):
             if not query and not title and not author:
                 messages.error(request, "Please enter a search term, title, or author")
             else:
+                update_fields = ["last_error"]
                 try:
                     provider_instance = get_provider_instance(provider)
                     search_results = provider_instance.search(
@@ -210,14 +264,12 @@ class SearchProviderAdmin(admin.ModelAdmin):
                     )
                     provider.last_checked_at = timezone.now()
                     provider.last_error = ""
-                    provider.save(update_fields=["last_checked_at", "last_error"])
+                    update_fields.append("last_checked_at")
 
                     results = [
                         {
                             "title": r.title,
-                            "authors": (
-                                ", ".join(r.authors) if r.authors else "Unknown"
-                            ),
+                            "authors": r.authors_display or "Unknown",
                             "publisher": r.publisher or "-",
                             "publication_date": (
                                 r.publication_date.isoformat()
@@ -227,11 +279,7 @@ class SearchProviderAdmin(admin.ModelAdmin):
                             "isbn": r.isbn or "-",
                             "isbn13": r.isbn13 or "-",
                             "language": r.language or "-",
-                            "description": (
-                                r.description[:200] + "..."
-                                if r.description and len(r.description) > 200
-                                else r.description or "-"
-                            ),
+                            "description": r.description_short or "-",
                             "cover_url": r.cover_url or "",
                             "provider": r.provider,
                             "provider_id": r.provider_id,
@@ -251,9 +299,10 @@ class SearchProviderAdmin(admin.ModelAdmin):
                         )
                 except Exception as e:
                     provider.last_error = str(e)
-                    provider.save(update_fields=["last_error"])
                     messages.error(request, f"Error: {str(e)}")
 
+                provider.save(update_fields=update_fields)
+
         context = {
             **self.admin_site.each_context(request),
             "title": f"Test Search - {provider.name}",
@@ -0,0 +1,20 @@
+# Generated by Django 6.1.2 on 2026-10-16 04:40
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="searchprovider",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["supports_media_types"], name="sp_media_types_gin"
+            ),
+        ),
+    ]
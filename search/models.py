@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator
 from django.db import models
 
@@ -43,6 +44,7 @@ class SearchProvider(BaseModel):
         indexes = [
             models.Index(fields=["provider_type", "enabled"]),
             models.Index(fields=["enabled", "priority"]),
+            GinIndex(fields=["supports_media_types"], name="sp_media_types_gin"),
         ]
 
     def __str__(self) -> str:
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
 from datetime import date
-from typing import Any
+from typing import Any, ClassVar
 
 import httpx
 
@@ -9,9 +16,67 @@ from search.providers.base import BaseProvider
 from search.providers.results import BookMetadata, NormalizedMetadata
 
 
+PROVIDER_NAME = "openlibrary"
+
+MAX_RESULTS = 20
+FILTERED_FETCH_LIMIT = 50
+
+IDENTIFIER_CACHE_SIZE = 4096
+IDENTIFIER_CACHE_TTL = 900
+
+_WORKS_PREFIX = "/works/"
+_BOOKS_PREFIX = "/books/"
+
+_LANGUAGE_MAP: dict[str, frozenset[str]] = {
+    "en": frozenset({"eng", "en", "english"}),
+    "fr": frozenset({"fre", "fr", "french"}),
+    "de": frozenset({"ger", "de", "german"}),
+    "es": frozenset({"spa", "es", "spanish"}),
+    "it": frozenset({"ita", "it", "italian"}),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _language_pattern(language: str) -> re.Pattern[str]:
+    target_langs = _LANGUAGE_MAP.get(language, frozenset({language}))
+    return re.compile("|".join(map(re.escape, target_langs)))
+
+
+def _copy_metadata(metadata: NormalizedMetadata) -> NormalizedMetadata:
+    return replace(
+        metadata,
+        authors=list(metadata.authors),
+        genres=list(metadata.genres),
+        tags=list(metadata.tags),
+        narrators=list(metadata.narrators),
+    )
+
+
 class OpenLibraryProvider(BaseProvider):
     """OpenLibrary API provider"""
 
+    _client: ClassVar[httpx.Client | None] = None
+    _client_lock: ClassVar[threading.Lock] = threading.Lock()
+    _identifier_cache: ClassVar[
+        OrderedDict[tuple[str, str, str], tuple[float, NormalizedMetadata]]
+    ] = OrderedDict()
+    _identifier_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _get_client(cls) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use"""
+        if cls._client is None:
+            with cls._client_lock:
+                if cls._client is None:
+                    client = httpx.Client(
+                        http2=True,
+                        timeout=10.0,
+                        limits=httpx.Limits(max_keepalive_connections=20),
+                    )
+                    atexit.register(client.close)
+                    cls._client = client
+        return cls._client
+
     def search(
         self,
         query: str,
@@ -51,39 +116,27 @@ class OpenLibraryProvider(BaseProvider):
 
         params = {
             "q": search_query,
-            "limit": 50,
+            "limit": MAX_RESULTS if language is None else FILTERED_FETCH_LIMIT,
             "fields": "key,title,author_name,authors,isbn,first_publish_year,publish_date,cover_i,number_of_pages_median,number_of_pages,publisher,language,first_sentence,subject,series,series_index",
         }
 
         try:
-            response = httpx.get(url, params=params, timeout=10.0)
+            response = self._get_client().get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
+            lang_re = _language_pattern(language.lower()) if language else None
+
             results = []
             for doc in data.get("docs", []):
                 normalized = self.normalize_result(doc)
                 if normalized:
-                    if language:
+                    if lang_re is not None:
                         normalized_lang = normalized.language.lower()
-                        language_map = {
-                            "en": ["eng", "en", "english"],
-                            "fr": ["fre", "fr", "french"],
-                            "de": ["ger", "de", "german"],
-                            "es": ["spa", "es", "spanish"],
-                            "it": ["ita", "it", "italian"],
-                        }
-                        target_langs = language_map.get(
-                            language.lower(), [language.lower()]
-                        )
-                        if normalized_lang and not any(
-                            target_lang in normalized_lang
-                            or normalized_lang in target_lang
-                            for target_lang in target_langs
-                        ):
+                        if normalized_lang and not lang_re.search(normalized_lang):
                             continue
                     results.append(normalized)
-                    if len(results) >= 20:
+                    if len(results) >= MAX_RESULTS:
                         break
 
             return results
@@ -103,10 +156,35 @@ class OpenLibraryProvider(BaseProvider):
         Returns:
             Normalized BookMetadata or None if not found
         """
+        key = (self.base_url or "", identifier_type, identifier)
+        now = time.monotonic()
+        with self._identifier_cache_lock:
+            cached = self._identifier_cache.get(key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._identifier_cache.move_to_end(key)
+                    return _copy_metadata(cached[1])
+                del self._identifier_cache[key]
+
+        result = self._fetch_by_identifier(identifier, identifier_type)
+        if result is not None:
+            with self._identifier_cache_lock:
+                self._identifier_cache[key] = (
+                    now + IDENTIFIER_CACHE_TTL,
+                    _copy_metadata(result),
+                )
+                self._identifier_cache.move_to_end(key)
+                if len(self._identifier_cache) > IDENTIFIER_CACHE_SIZE:
+                    self._identifier_cache.popitem(last=False)
+        return result
+
+    def _fetch_by_identifier(
+        self, identifier: str, identifier_type: str
+    ) -> NormalizedMetadata | None:
         if identifier_type == "openlibrary_id":
             url = f"{self.base_url}/works/{identifier}.json"
             try:
-                response = httpx.get(url, timeout=10.0)
+                response = self._get_client().get(url)
                 response.raise_for_status()
                 data = response.json()
                 return self.normalize_result(data)
@@ -130,12 +208,13 @@ class OpenLibraryProvider(BaseProvider):
         Returns:
             Normalized BookMetadata object
         """
-        title = raw_result.get("title", "")
+        get = raw_result.get
+        title = get("title", "")
         if not title:
             return None
 
         provider_id = (
-            raw_result.get("key", "").replace("/works/", "").replace("/books/", "")
+            get("key", "").removeprefix(_WORKS_PREFIX).removeprefix(_BOOKS_PREFIX)
         )
 
         authors = []
@@ -147,20 +226,22 @@ class OpenLibraryProvider(BaseProvider):
                 for author in raw_result["authors"]
             ]
 
-        isbn_list = raw_result.get("isbn", [])
+        isbn_list = get("isbn", [])
         isbn = ""
         isbn13 = ""
         for isbn_val in isbn_list:
             isbn_str = str(isbn_val)
-            if len(isbn_str) == 10:
-                isbn = isbn_str
-            elif len(isbn_str) == 13:
-                isbn13 = isbn_str
+            if len(isbn_str) == 13:
+                if not isbn13 and isbn_str.isdigit():
+                    isbn13 = isbn_str
+            elif len(isbn_str) == 10:
+                if not isbn and isbn_str[:9].isdigit():
+                    isbn = isbn_str
+            if isbn and isbn13:
+                break
 
         publication_date = None
-        publish_date = raw_result.get("first_publish_year") or raw_result.get(
-            "publish_date", []
-        )
+        publish_date = get("first_publish_year") or get("publish_date", [])
         if publish_date:
             if isinstance(publish_date, list) and publish_date:
                 publish_date = publish_date[0]
@@ -174,18 +255,16 @@ class OpenLibraryProvider(BaseProvider):
                 publication_date = date(publish_date, 1, 1)
 
         cover_url = ""
-        cover_id = raw_result.get("cover_i")
+        cover_id = get("cover_i")
         if cover_id:
             cover_url = f"https://covers.openlibrary.org/b/id/{cover_id}-L.jpg"
 
-        page_count = raw_result.get("number_of_pages_median") or raw_result.get(
-            "number_of_pages"
-        )
+        page_count = get("number_of_pages_median") or get("number_of_pages")
 
-        publisher_list = raw_result.get("publisher", [])
+        publisher_list = get("publisher", [])
         publisher = publisher_list[0] if publisher_list else ""
 
-        language_list = raw_result.get("language", [])
+        language_list = get("language", [])
         language = language_list[0] if language_list else ""
 
         description = ""
@@ -196,13 +275,13 @@ class OpenLibraryProvider(BaseProvider):
             else:
                 description = str(first_sentence)
 
-        subjects = raw_result.get("subject", [])
+        subjects = get("subject", [])
         genres = subjects[:5] if subjects else []
 
-        series_list = raw_result.get("series", [])
+        series_list = get("series", [])
         series = series_list[0] if series_list else ""
 
-        series_index = raw_result.get("series_index")
+        series_index = get("series_index")
         if series_index is not None:
             try:
                 series_index = float(series_index)
@@ -210,7 +289,7 @@ class OpenLibraryProvider(BaseProvider):
                 series_index = None
 
         return BookMetadata(
-            provider="openlibrary",
+            provider=PROVIDER_NAME,
             provider_id=provider_id,
             title=title,
             authors=authors,
@@ -230,7 +309,7 @@ class OpenLibraryProvider(BaseProvider):
     def test_connection(self) -> bool:
         """Test if OpenLibrary is accessible"""
         try:
-            response = httpx.get(
+            response = self._get_client().get(
                 f"{self.base_url}/search.json", params={"q": "test"}, timeout=5.0
             )
             return response.status_code == 200
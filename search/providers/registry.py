@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import threading
+from datetime import datetime
 from typing import Any
+from uuid import UUID
 
 from search.models import ProviderType, SearchProvider
 from search.providers.base import BaseProvider
@@ -10,11 +13,18 @@ PROVIDER_CLASSES: dict[str, type[BaseProvider]] = {
     ProviderType.OPENLIBRARY: OpenLibraryProvider,
 }
 
+INSTANCE_CACHE_SIZE = 64
+
+_INSTANCE_CACHE: dict[tuple[UUID, datetime], BaseProvider] = {}
+_INSTANCE_CACHE_LOCK = threading.Lock()
+
 
 def get_provider_instance(provider_model: SearchProvider) -> BaseProvider:
     """
     Create provider instance from database model.
 
+    Instances of saved providers are cached until the model is next updated.
+
     Args:
         provider_model: SearchProvider database model instance
 
@@ -24,6 +34,24 @@ def get_provider_instance(provider_model: SearchProvider) -> BaseProvider:
     Raises:
         ValueError: If provider type is not registered
     """
+    if provider_model.updated_at is None:
+        return _build_provider_instance(provider_model)
+
+    key = (provider_model.pk, provider_model.updated_at)
+    with _INSTANCE_CACHE_LOCK:
+        instance = _INSTANCE_CACHE.get(key)
+    if instance is not None:
+        return instance
+
+    instance = _build_provider_instance(provider_model)
+    with _INSTANCE_CACHE_LOCK:
+        _INSTANCE_CACHE[key] = instance
+        if len(_INSTANCE_CACHE) > INSTANCE_CACHE_SIZE:
+            del _INSTANCE_CACHE[next(iter(_INSTANCE_CACHE))]
+    return instance
+
+
+def _build_provider_instance(provider_model: SearchProvider) -> BaseProvider:
     provider_class = PROVIDER_CLASSES.get(provider_model.provider_type)
     if not provider_class:
         raise ValueError(f"Unknown provider type: {provider_model.provider_type}")
@@ -49,9 +77,22 @@ def get_enabled_providers(media_type: str) -> list[BaseProvider]:
     Returns:
         List of enabled provider instances, ordered by priority
     """
-    providers = SearchProvider.objects.filter(
-        enabled=True,
-        supports_media_types__contains=[media_type],
-    ).order_by("priority")
+    providers = (
+        SearchProvider.objects.filter(
+            enabled=True,
+            supports_media_types__contains=[media_type],
+        )
+        .only(
+            "pk",
+            "provider_type",
+            "api_key",
+            "base_url",
+            "enabled",
+            "rate_limit_per_minute",
+            "config",
+            "updated_at",
+        )
+        .order_by("priority")
+    )
 
     return [get_provider_instance(p) for p in providers]
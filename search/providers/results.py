@@ -4,8 +4,10 @@ from abc import ABC
 from dataclasses import dataclass, field
 from datetime import date
 
+DESCRIPTION_PREVIEW_LENGTH = 200
 
-@dataclass
+
+@dataclass(slots=True)
 class BaseNormalizedMetadata(ABC):
     """Base class for normalized metadata - common fields for all media types"""
 
@@ -23,6 +25,19 @@ class BaseNormalizedMetadata(ABC):
     series: str = ""
     series_index: float | None = None
 
+    @property
+    def authors_display(self) -> str:
+        """Authors joined with commas for display"""
+        return ", ".join(self.authors)
+
+    @property
+    def description_short(self) -> str:
+        """Description cut to DESCRIPTION_PREVIEW_LENGTH characters for display"""
+        description = self.description or ""
+        if len(description) > DESCRIPTION_PREVIEW_LENGTH:
+            return f"{description[:DESCRIPTION_PREVIEW_LENGTH]}..."
+        return description
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
         result = {
@@ -45,7 +60,7 @@ class BaseNormalizedMetadata(ABC):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class BookMetadata(BaseNormalizedMetadata):
     """Normalized metadata for books and audiobooks"""
 
@@ -60,32 +75,47 @@ class BookMetadata(BaseNormalizedMetadata):
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
-        result = super().to_dict()
-        result.update(
-            {
-                "isbn": self.isbn,
-                "isbn13": self.isbn13,
-                "page_count": self.page_count,
-                "edition": self.edition,
-                "narrators": self.narrators,
-                "duration_seconds": self.duration_seconds,
-                "bitrate": self.bitrate,
-                "chapters": self.chapters,
-            }
-        )
-        return result
+        publication_date = self.publication_date
+        return {
+            "provider": self.provider,
+            "provider_id": self.provider_id,
+            "title": self.title,
+            "authors": self.authors,
+            "description": self.description,
+            "publisher": self.publisher,
+            "publication_date": (
+                publication_date.isoformat() if publication_date else None
+            ),
+            "cover_url": self.cover_url,
+            "language": self.language,
+            "genres": self.genres,
+            "tags": self.tags,
+            "series": self.series,
+            "series_index": self.series_index,
+            "isbn": self.isbn,
+            "isbn13": self.isbn13,
+            "page_count": self.page_count,
+            "edition": self.edition,
+            "narrators": self.narrators,
+            "duration_seconds": self.duration_seconds,
+            "bitrate": self.bitrate,
+            "chapters": self.chapters,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> BookMetadata:
         """Create from dictionary"""
-        publication_date = None
-        if data.get("publication_date"):
-            if isinstance(data["publication_date"], str):
-                publication_date = date.fromisoformat(data["publication_date"])
-            elif isinstance(data["publication_date"], date):
-                publication_date = data["publication_date"]
-
-        series_index = data.get("series_index")
+        get = data.get
+
+        publication_date = get("publication_date")
+        if not publication_date:
+            publication_date = None
+        elif type(publication_date) is str:
+            publication_date = date.fromisoformat(publication_date)
+        elif not isinstance(publication_date, date):
+            publication_date = None
+
+        series_index = get("series_index")
         if series_index is not None:
             try:
                 series_index = float(series_index)
@@ -93,27 +123,27 @@ class BookMetadata(BaseNormalizedMetadata):
                 series_index = None
 
         return cls(
-            provider=data.get("provider", ""),
-            provider_id=data.get("provider_id", ""),
-            title=data.get("title", ""),
-            authors=data.get("authors", []),
-            description=data.get("description", ""),
-            publisher=data.get("publisher", ""),
+            provider=get("provider", ""),
+            provider_id=get("provider_id", ""),
+            title=get("title", ""),
+            authors=get("authors", []),
+            description=get("description", ""),
+            publisher=get("publisher", ""),
             publication_date=publication_date,
-            cover_url=data.get("cover_url", ""),
-            language=data.get("language", ""),
-            genres=data.get("genres", []),
-            tags=data.get("tags", []),
-            series=data.get("series", ""),
+            cover_url=get("cover_url", ""),
+            language=get("language", ""),
+            genres=get("genres", []),
+            tags=get("tags", []),
+            series=get("series", ""),
             series_index=series_index,
-            isbn=data.get("isbn", ""),
-            isbn13=data.get("isbn13", ""),
-            page_count=data.get("page_count"),
-            edition=data.get("edition", ""),
-            narrators=data.get("narrators", []),
-            duration_seconds=data.get("duration_seconds"),
-            bitrate=data.get("bitrate"),
-            chapters=data.get("chapters"),
+            isbn=get("isbn", ""),
+            isbn13=get("isbn13", ""),
+            page_count=get("page_count"),
+            edition=get("edition", ""),
+            narrators=get("narrators", []),
+            duration_seconds=get("duration_seconds"),
+            bitrate=get("bitrate"),
+            chapters=get("chapters"),
         )
 
 
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import dramatiq
+from django.utils import timezone
+
+from search.models import SearchProvider
+from search.providers.registry import get_provider_instance
+
+
+def check_provider_connection(provider: SearchProvider) -> str | None:
+    try:
+        if get_provider_instance(provider).test_connection():
+            return None
+        return "Connection test failed"
+    except Exception as e:
+        return str(e)
+
+
+@dramatiq.actor(max_retries=0, time_limit=15_000)
+def run_connection_test(provider_id: str) -> None:
+    """Test a provider's connection and record the outcome on the model."""
+    provider = SearchProvider.objects.filter(pk=provider_id).first()
+    if provider is None:
+        return
+
+    error = check_provider_connection(provider)
+    if error is None:
+        provider.last_checked_at = timezone.now()
+        provider.last_error = ""
+        provider.save(update_fields=["last_checked_at", "last_error"])
+    else:
+        provider.last_error = error
+        provider.save(update_fields=["last_error"])
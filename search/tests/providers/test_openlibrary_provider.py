@@ -10,6 +10,11 @@ from search.providers.openlibrary import OpenLibraryProvider
 from search.providers.results import BookMetadata
 
 
+@pytest.fixture(autouse=True)
+def clear_identifier_cache():
+    OpenLibraryProvider._identifier_cache.clear()
+
+
 @pytest.fixture
 def provider_config() -> dict:
     return {
@@ -79,7 +84,8 @@ class TestOpenLibraryProviderSearch:
     def test_search_returns_results(
         self, provider: OpenLibraryProvider, mock_search_response: dict
     ):
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_search_response
@@ -93,6 +99,40 @@ class TestOpenLibraryProviderSearch:
             assert results[0].title == "Dune"
             assert results[0].authors == ["Frank Herbert"]
 
+    def test_search_filters_by_language(self, provider: OpenLibraryProvider):
+        language_response = {
+            "numFound": 3,
+            "docs": [
+                {"key": "/works/OL1W", "title": "English", "language": ["eng"]},
+                {"key": "/works/OL2W", "title": "French", "language": ["fre"]},
+                {"key": "/works/OL3W", "title": "Unknown"},
+            ],
+        }
+
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = language_response
+            mock_response.raise_for_status = Mock()
+            mock_get.return_value = mock_response
+
+            results = provider.search("test", "book", language="en")
+
+            assert [r.title for r in results] == ["English", "Unknown"]
+            assert mock_get.call_args.kwargs["params"]["limit"] == 50
+
+    def test_search_requests_only_the_result_cap_without_language(
+        self, provider: OpenLibraryProvider, mock_search_response: dict
+    ):
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
+            mock_get.return_value.json.return_value = mock_search_response
+
+            provider.search("dune", "book")
+
+            assert mock_get.call_args.kwargs["params"]["limit"] == 20
+
     def test_search_filters_invalid_results(self, provider: OpenLibraryProvider):
         invalid_response = {
             "numFound": 1,
@@ -101,7 +141,8 @@ class TestOpenLibraryProviderSearch:
             ],
         }
 
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = invalid_response
@@ -113,7 +154,8 @@ class TestOpenLibraryProviderSearch:
             assert len(results) == 0
 
     def test_search_handles_http_error(self, provider: OpenLibraryProvider):
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_get.side_effect = httpx.HTTPError("Connection error")
 
             results = provider.search("dune", "book")
@@ -134,7 +176,8 @@ class TestOpenLibraryProviderFetchByIdentifier:
     def test_fetch_by_openlibrary_id(
         self, provider: OpenLibraryProvider, mock_work_response: dict
     ):
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_work_response
@@ -151,7 +194,8 @@ class TestOpenLibraryProviderFetchByIdentifier:
     def test_fetch_by_isbn(
         self, provider: OpenLibraryProvider, mock_search_response: dict
     ):
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_search_response
@@ -167,7 +211,8 @@ class TestOpenLibraryProviderFetchByIdentifier:
     def test_fetch_by_isbn13(
         self, provider: OpenLibraryProvider, mock_search_response: dict
     ):
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = mock_search_response
@@ -182,13 +227,63 @@ class TestOpenLibraryProviderFetchByIdentifier:
     def test_fetch_by_identifier_handles_http_error(
         self, provider: OpenLibraryProvider
     ):
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_get.side_effect = httpx.HTTPError("Connection error")
 
             result = provider.fetch_by_identifier("OL123456W", "openlibrary_id")
 
             assert result is None
 
+    def test_fetch_by_isbn_reuses_cached_result(
+        self, provider: OpenLibraryProvider, mock_search_response: dict
+    ):
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
+            mock_get.return_value.json.return_value = mock_search_response
+
+            first = provider.fetch_by_identifier("0441013597", "isbn")
+            second = provider.fetch_by_identifier("0441013597", "isbn")
+
+            assert first is not None
+            assert second == first
+            mock_get.assert_called_once()
+
+    def test_fetch_by_isbn_cached_result_is_a_copy(
+        self, provider: OpenLibraryProvider, mock_search_response: dict
+    ):
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
+            mock_get.return_value.json.return_value = mock_search_response
+
+            first = provider.fetch_by_identifier("0441013597", "isbn")
+            first.authors.append("Someone Else")
+            first.title = "Changed"
+            second = provider.fetch_by_identifier("0441013597", "isbn")
+            second.authors.clear()
+            third = provider.fetch_by_identifier("0441013597", "isbn")
+
+            assert third.title == "Dune"
+            assert third.authors == ["Frank Herbert"]
+            mock_get.assert_called_once()
+
+    def test_fetch_by_isbn_refetches_after_ttl(
+        self, provider: OpenLibraryProvider, mock_search_response: dict
+    ):
+        with (
+            patch.object(OpenLibraryProvider, "_get_client") as get_client,
+            patch("search.providers.openlibrary.time.monotonic") as monotonic,
+        ):
+            mock_get = get_client.return_value.get
+            mock_get.return_value.json.return_value = mock_search_response
+
+            monotonic.return_value = 0.0
+            provider.fetch_by_identifier("0441013597", "isbn")
+            monotonic.return_value = 901.0
+            provider.fetch_by_identifier("0441013597", "isbn")
+
+            assert mock_get.call_count == 2
+
     def test_fetch_by_unsupported_identifier_type(self, provider: OpenLibraryProvider):
         result = provider.fetch_by_identifier("test", "unknown_type")
         assert result is None
@@ -245,6 +340,29 @@ class TestOpenLibraryProviderNormalizeResult:
 
         assert result is not None
         assert result.authors == ["Author One", "Author Two"]
+        assert result.authors_display == "Author One, Author Two"
+
+    def test_normalize_result_keeps_first_valid_isbns(
+        self, provider: OpenLibraryProvider
+    ):
+        raw_result = {
+            "key": "/works/OL123456W",
+            "title": "Test Book",
+            "isbn": [
+                "0-441-0135",
+                "044101359X",
+                "978-0441013",
+                "9780441013593",
+                "0441013597",
+                "9780441013594",
+            ],
+        }
+
+        result = provider.normalize_result(raw_result)
+
+        assert result is not None
+        assert result.isbn == "044101359X"
+        assert result.isbn13 == "9780441013593"
 
     def test_normalize_result_with_publish_date_string(
         self, provider: OpenLibraryProvider
@@ -342,7 +460,8 @@ class TestOpenLibraryProviderNormalizeResult:
 
 class TestOpenLibraryProviderTestConnection:
     def test_test_connection_success(self, provider: OpenLibraryProvider):
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_response = Mock()
             mock_response.status_code = 200
             mock_get.return_value = mock_response
@@ -352,7 +471,8 @@ class TestOpenLibraryProviderTestConnection:
             assert result is True
 
     def test_test_connection_failure(self, provider: OpenLibraryProvider):
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_get.side_effect = httpx.HTTPError("Connection error")
 
             result = provider.test_connection()
@@ -360,7 +480,8 @@ class TestOpenLibraryProviderTestConnection:
             assert result is False
 
     def test_test_connection_non_200_status(self, provider: OpenLibraryProvider):
-        with patch("httpx.get") as mock_get:
+        with patch.object(OpenLibraryProvider, "_get_client") as get_client:
+            mock_get = get_client.return_value.get
             mock_response = Mock()
             mock_response.status_code = 500
             mock_get.return_value = mock_response
@@ -368,3 +489,18 @@ class TestOpenLibraryProviderTestConnection:
             result = provider.test_connection()
 
             assert result is False
+
+
+class TestOpenLibraryProviderClient:
+    def test_get_client_is_shared_across_instances(self, provider_config: dict):
+        with (
+            patch.object(OpenLibraryProvider, "_client", None),
+            patch("httpx.Client") as mock_client_cls,
+            patch("atexit.register"),
+        ):
+            first = OpenLibraryProvider(provider_config)._get_client()
+            second = OpenLibraryProvider(provider_config)._get_client()
+
+        assert first is second
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.call_args.kwargs["http2"] is True
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import date
+
+from search.providers.results import BookMetadata
+
+
+class TestBookMetadata:
+    def test_to_dict_round_trips_through_from_dict(self):
+        metadata = BookMetadata(
+            provider="openlibrary",
+            provider_id="OL123456W",
+            title="Dune",
+            authors=["Frank Herbert"],
+            publication_date=date(1965, 1, 1),
+            series="Dune",
+            series_index=1.0,
+            isbn="0441013597",
+            isbn13="9780441013593",
+            page_count=688,
+            narrators=["Scott Brick"],
+        )
+
+        data = metadata.to_dict()
+
+        assert data["publication_date"] == "1965-01-01"
+        assert data["isbn13"] == "9780441013593"
+        assert BookMetadata.from_dict(data) == metadata
+
+    def test_to_dict_without_publication_date(self):
+        metadata = BookMetadata(provider="openlibrary", provider_id="1", title="T")
+
+        data = metadata.to_dict()
+
+        assert data["publication_date"] is None
+        assert data["authors"] == []
+        assert BookMetadata.from_dict(data) == metadata
+
+    def test_from_dict_accepts_date_and_ignores_bad_series_index(self):
+        metadata = BookMetadata.from_dict(
+            {
+                "provider": "openlibrary",
+                "provider_id": "1",
+                "title": "T",
+                "publication_date": date(2001, 5, 1),
+                "series_index": "not a number",
+            }
+        )
+
+        assert metadata.publication_date == date(2001, 5, 1)
+        assert metadata.series_index is None
+
+    def test_description_short_truncates_long_descriptions(self):
+        metadata = BookMetadata(
+            provider="openlibrary", provider_id="1", title="T", description="x" * 201
+        )
+
+        assert metadata.description_short == "x" * 200 + "..."
+
+        metadata.description = "short"
+        assert metadata.description_short == "short"
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from django.contrib import admin, messages
+from django.test import RequestFactory
+from django.utils import timezone
+
+from search.admin import SearchProviderAdmin
+from search.models import ProviderType, SearchProvider
+from search.providers.results import BookMetadata
+
+
+@pytest.fixture
+def model_admin() -> SearchProviderAdmin:
+    return SearchProviderAdmin(SearchProvider, admin.site)
+
+
+@pytest.fixture
+def providers() -> list[SearchProvider]:
+    return [
+        SearchProvider.objects.create(
+            name=f"Provider {i}",
+            provider_type=ProviderType.OPENLIBRARY,
+            base_url="https://openlibrary.org",
+            priority=i,
+        )
+        for i in range(3)
+    ]
+
+
+def _provider_instance(name: str) -> Mock:
+    instance = Mock()
+    if name == "Provider 1":
+        instance.test_connection.return_value = False
+        instance.search.side_effect = RuntimeError("boom")
+    else:
+        instance.test_connection.return_value = True
+        instance.search.return_value = [
+            BookMetadata(
+                provider="openlibrary",
+                provider_id="OL1W",
+                title="Dune",
+                authors=["Frank Herbert"],
+            )
+        ]
+    return instance
+
+
+@pytest.mark.django_db
+class TestSearchProviderAdminActions:
+    def test_test_connection_reports_each_provider(
+        self,
+        model_admin: SearchProviderAdmin,
+        providers: list[SearchProvider],
+        django_assert_num_queries,
+    ):
+        request = RequestFactory().post("/")
+        with (
+            patch(
+                "search.tasks.get_provider_instance",
+                side_effect=lambda p: _provider_instance(p.name),
+            ),
+            patch.object(model_admin, "message_user") as message_user,
+        ):
+            with django_assert_num_queries(3):
+                model_admin.test_connection(
+                    request, SearchProvider.objects.order_by("priority")
+                )
+
+        levels = [call.args[2] for call in message_user.call_args_list]
+        assert levels == [messages.SUCCESS, messages.ERROR, messages.SUCCESS]
+
+        for provider in providers:
+            provider.refresh_from_db()
+        assert providers[0].last_checked_at is not None
+        assert providers[0].last_error == ""
+        assert providers[1].last_checked_at is None
+        assert providers[1].last_error == "Connection test failed"
+
+    def test_test_connection_keeps_newer_checked_at_on_failure(
+        self, model_admin: SearchProviderAdmin, providers: list[SearchProvider]
+    ):
+        earlier = timezone.now() - timedelta(hours=1)
+        newer = timezone.now()
+        SearchProvider.objects.filter(pk=providers[1].pk).update(
+            last_checked_at=earlier
+        )
+
+        def record_concurrent_success(request, message, level):
+            if level == messages.ERROR:
+                SearchProvider.objects.filter(pk=providers[1].pk).update(
+                    last_checked_at=newer
+                )
+
+        request = RequestFactory().post("/")
+        with (
+            patch(
+                "search.tasks.get_provider_instance",
+                side_effect=lambda p: _provider_instance(p.name),
+            ),
+            patch.object(
+                model_admin, "message_user", side_effect=record_concurrent_success
+            ),
+        ):
+            model_admin.test_connection(
+                request, SearchProvider.objects.order_by("priority")
+            )
+
+        providers[1].refresh_from_db()
+        assert providers[1].last_checked_at == newer
+        assert providers[1].last_error == "Connection test failed"
+
+    def test_test_search_reports_each_provider(
+        self, model_admin: SearchProviderAdmin, providers: list[SearchProvider]
+    ):
+        request = RequestFactory().post("/")
+        with (
+            patch(
+                "search.admin.get_provider_instance",
+                side_effect=lambda p: _provider_instance(p.name),
+            ),
+            patch.object(model_admin, "message_user") as message_user,
+        ):
+            model_admin.test_search(
+                request, SearchProvider.objects.order_by("priority")
+            )
+
+        levels = [call.args[2] for call in message_user.call_args_list]
+        assert levels == [messages.SUCCESS, messages.ERROR, messages.SUCCESS]
+        assert "Found 1 results" in message_user.call_args_list[0].args[1]
+
+        providers[1].refresh_from_db()
+        assert providers[1].last_error == "boom"
@@ -64,6 +64,24 @@ class TestGetProviderInstance:
             "rate_limit_per_minute": 60,
         }
 
+    def test_reuses_instance_until_provider_is_updated(self):
+        provider = SearchProvider.objects.create(
+            name="Cached Provider",
+            provider_type=ProviderType.OPENLIBRARY,
+            base_url="https://openlibrary.org",
+            enabled=True,
+        )
+        first = get_provider_instance(provider)
+        assert (
+            get_provider_instance(SearchProvider.objects.get(pk=provider.pk)) is first
+        )
+
+        provider.base_url = "https://example.com"
+        provider.save()
+        updated = get_provider_instance(provider)
+        assert updated is not first
+        assert updated.base_url == "https://example.com"
+
 
 @pytest.mark.django_db
 class TestGetEnabledProviders:
@@ -187,3 +205,17 @@ class TestGetEnabledProviders:
         assert len(audiobook_results) == 1
         assert book_results[0].config["base_url"] == provider.base_url
         assert audiobook_results[0].config["base_url"] == provider.base_url
+
+    def test_builds_instances_from_a_single_query(self, django_assert_num_queries):
+        for i in range(3):
+            SearchProvider.objects.create(
+                name=f"Provider {i}",
+                provider_type=ProviderType.OPENLIBRARY,
+                base_url="https://openlibrary.org",
+                enabled=True,
+                supports_media_types=["book"],
+                priority=i,
+            )
+        with django_assert_num_queries(1):
+            results = get_enabled_providers("book")
+        assert len(results) == 3
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from search.models import ProviderType, SearchProvider
+from search.tasks import run_connection_test
+
+
+@pytest.fixture
+def provider() -> SearchProvider:
+    return SearchProvider.objects.create(
+        name="Test OpenLibrary",
+        provider_type=ProviderType.OPENLIBRARY,
+        base_url="https://openlibrary.org",
+    )
+
+
+@pytest.mark.django_db
+class TestRunConnectionTest:
+    def test_records_success(self, provider: SearchProvider):
+        with patch("search.tasks.get_provider_instance") as mock_instance:
+            mock_instance.return_value.test_connection.return_value = True
+            run_connection_test.fn(str(provider.pk))
+
+        provider.refresh_from_db()
+        assert provider.last_checked_at is not None
+        assert provider.last_error == ""
+
+    def test_records_error(self, provider: SearchProvider):
+        with patch("search.tasks.get_provider_instance") as mock_instance:
+            mock_instance.return_value.test_connection.side_effect = RuntimeError(
+                "unreachable"
+            )
+            run_connection_test.fn(str(provider.pk))
+
+        provider.refresh_from_db()
+        assert provider.last_checked_at is None
+        assert provider.last_error == "unreachable"
+
+    def test_ignores_deleted_provider(self, provider: SearchProvider):
+        provider_id = str(provider.pk)
+        provider.delete()
+
+        with patch("search.tasks.get_provider_instance") as mock_instance:
+            run_connection_test.fn(provider_id)
+
+        mock_instance.assert_not_called()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from search.models import ProviderType, SearchProvider
+from search.providers.results import BookMetadata
+
+
+@pytest.fixture
+def client() -> Client:
+    return Client()
+
+
+@pytest.fixture
+def provider() -> SearchProvider:
+    return SearchProvider.objects.create(
+        name="OpenLibrary",
+        provider_type=ProviderType.OPENLIBRARY,
+        base_url="https://openlibrary.org",
+        supports_media_types=["book"],
+    )
+
+
+@pytest.mark.django_db
+class TestSearchView:
+    def test_post_fetches_providers_once(
+        self, client: Client, provider: SearchProvider, django_assert_num_queries
+    ):
+        with (
+            patch("search.views.get_provider_instance") as mock_instance,
+            django_assert_num_queries(1),
+        ):
+            mock_instance.return_value.search.return_value = []
+            response = client.post(
+                reverse("search:search"),
+                {
+                    "title": "Dune",
+                    "media_type": "book",
+                    "provider_id": str(provider.id),
+                },
+            )
+
+        assert response.context["providers"] == [provider]
+
+    def test_post_rejects_unsupported_media_type(
+        self, client: Client, provider: SearchProvider
+    ):
+        with patch("search.views.get_provider_instance") as mock_instance:
+            response = client.post(
+                reverse("search:search"),
+                {
+                    "title": "Dune",
+                    "media_type": "audiobook",
+                    "provider_id": str(provider.id),
+                },
+            )
+
+        mock_instance.assert_not_called()
+        assert [str(m) for m in response.context["messages"]] == [
+            "Provider OpenLibrary does not support audiobook"
+        ]
+        assert response.context["providers"] == []
+
+    def test_post_formats_results(self, client: Client, provider: SearchProvider):
+        metadata = BookMetadata(
+            provider="openlibrary",
+            provider_id="OL123456W",
+            title="Dune",
+            authors=["Frank Herbert", "Brian Herbert"],
+            publication_date=date(1965, 1, 1),
+            description="x" * 250,
+            isbn13="9780441013593",
+        )
+        with patch("search.views.get_provider_instance") as mock_instance:
+            mock_instance.return_value.search.return_value = [metadata]
+            response = client.post(
+                reverse("search:search"),
+                {
+                    "title": "Dune",
+                    "media_type": "book",
+                    "provider_id": str(provider.id),
+                },
+            )
+
+        assert response.status_code == 200
+        [result] = response.context["results"]
+        assert result["authors"] == "Frank Herbert, Brian Herbert"
+        assert result["publication_date"] == "1965-01-01"
+        assert result["description"] == "x" * 200 + "..."
+        assert result["isbn"] == "-"
+        assert result["isbn13"] == "9780441013593"
+        assert result["metadata"] == metadata.to_dict()
+        assert [p.name for p in response.context["providers"]] == ["OpenLibrary"]
+
+
+@pytest.mark.django_db
+class TestGetProvidersJson:
+    def test_lists_enabled_providers_for_media_type(
+        self, client: Client, provider: SearchProvider
+    ):
+        SearchProvider.objects.create(
+            name="Disabled",
+            provider_type=ProviderType.OPENLIBRARY,
+            base_url="https://openlibrary.org",
+            supports_media_types=["book"],
+            enabled=False,
+        )
+
+        response = client.get(reverse("search:providers_json"), {"media_type": "book"})
+
+        assert response.json() == {
+            "providers": [
+                {
+                    "id": str(provider.id),
+                    "name": "OpenLibrary",
+                    "provider_type": "OpenLibrary",
+                }
+            ]
+        }
+
+    def test_returns_empty_list_without_media_type(self, client: Client):
+        response = client.get(reverse("search:providers_json"))
+
+        assert response.json() == {"providers": []}
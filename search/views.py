@@ -1,13 +1,44 @@
 from __future__ import annotations
 
-import json
+from typing import Any
+from uuid import UUID
 
 from django.contrib import messages
+from django.db.models import QuerySet
 from django.http import JsonResponse
 from django.shortcuts import render
 
-from search.models import SearchProvider
+from search.models import ProviderType, SearchProvider
 from search.providers.registry import get_provider_instance
+from search.providers.results import NormalizedMetadata
+
+
+_PROVIDER_TYPE_DISPLAY = dict(ProviderType.choices)
+_PROVIDER_OPTION_FIELDS = ("id", "name", "provider_type")
+
+
+def _enabled_providers(media_type: str) -> QuerySet[SearchProvider]:
+    return SearchProvider.objects.filter(
+        enabled=True, supports_media_types__contains=[media_type]
+    ).order_by("priority", "name")
+
+
+def _format_result(result: NormalizedMetadata) -> dict[str, Any]:
+    metadata = result.to_dict()
+    return {
+        "title": metadata["title"],
+        "authors": result.authors_display or "Unknown",
+        "publisher": metadata["publisher"] or "-",
+        "publication_date": metadata["publication_date"] or "-",
+        "isbn": metadata["isbn"] or "-",
+        "isbn13": metadata["isbn13"] or "-",
+        "language": metadata["language"] or "-",
+        "description": result.description_short or "-",
+        "cover_url": metadata["cover_url"] or "",
+        "provider": metadata["provider"],
+        "provider_id": metadata["provider_id"],
+        "metadata": metadata,
+    }
 
 
 def search_view(request):
@@ -30,8 +61,13 @@ def search_view(request):
             messages.error(request, "Please select a search provider")
         else:
             try:
-                provider = SearchProvider.objects.get(id=provider_id, enabled=True)
-                if media_type not in provider.supports_media_types:
+                requested_id = UUID(provider_id)
+                candidates = list(_enabled_providers(media_type))
+                provider = next((p for p in candidates if p.id == requested_id), None)
+                if provider is None:
+                    provider = SearchProvider.objects.only("name").get(
+                        id=requested_id, enabled=True
+                    )
                     messages.error(
                         request,
                         f"Provider {provider.name} does not support {media_type}",
@@ -46,36 +82,7 @@ def search_view(request):
                         author=author if author else None,
                     )
 
-                    results = []
-                    for r in search_results:
-                        metadata_dict = r.to_dict()
-                        results.append(
-                            {
-                                "title": r.title,
-                                "authors": (
-                                    ", ".join(r.authors) if r.authors else "Unknown"
-                                ),
-                                "publisher": r.publisher or "-",
-                                "publication_date": (
-                                    r.publication_date.isoformat()
-                                    if r.publication_date
-                                    else "-"
-                                ),
-                                "isbn": r.isbn or "-",
-                                "isbn13": r.isbn13 or "-",
-                                "language": r.language or "-",
-                                "description": (
-                                    r.description[:200] + "..."
-                                    if r.description and len(r.description) > 200
-                                    else r.description or "-"
-                                ),
-                                "cover_url": r.cover_url or "",
-                                "provider": r.provider,
-                                "provider_id": r.provider_id,
-                                "metadata": metadata_dict,
-                                "metadata_json": json.dumps(metadata_dict),
-                            }
-                        )
+                    results = [_format_result(r) for r in search_results]
 
                     if results:
                         messages.success(
@@ -89,11 +96,9 @@ def search_view(request):
                         )
 
                     selected_media_type = media_type
-                    selected_provider_id = str(provider_id)
+                    selected_provider_id = provider_id
 
-                    providers = SearchProvider.objects.filter(
-                        enabled=True, supports_media_types__contains=[media_type]
-                    ).order_by("priority", "name")
+                    providers = candidates
 
             except SearchProvider.DoesNotExist:
                 messages.error(request, "Provider not found")
@@ -102,9 +107,7 @@ def search_view(request):
     else:
         media_type = request.GET.get("media_type", "").strip()
         if media_type:
-            providers = SearchProvider.objects.filter(
-                enabled=True, supports_media_types__contains=[media_type]
-            ).order_by("priority", "name")
+            providers = _enabled_providers(media_type).only(*_PROVIDER_OPTION_FIELDS)
             selected_media_type = media_type
 
     context = {
@@ -122,17 +125,15 @@ def get_providers_json(request):
     if not media_type:
         return JsonResponse({"providers": []})
 
-    providers = SearchProvider.objects.filter(
-        enabled=True, supports_media_types__contains=[media_type]
-    ).order_by("priority", "name")
-
     providers_data = [
         {
-            "id": str(provider.id),
-            "name": provider.name,
-            "provider_type": provider.get_provider_type_display(),
+            "id": str(provider_id),
+            "name": name,
+            "provider_type": _PROVIDER_TYPE_DISPLAY.get(provider_type, provider_type),
         }
-        for provider in providers
+        for provider_id, name, provider_type in _enabled_providers(
+            media_type
+        ).values_list(*_PROVIDER_OPTION_FIELDS)
     ]
 
     return JsonResponse({"providers": providers_data})